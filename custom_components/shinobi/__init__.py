@@ -15,12 +15,18 @@ from .common.entity_descriptions import PLATFORMS
 from .managers.config_manager import ConfigManager
 from .managers.coordinator import Coordinator
 from .managers.password_manager import PasswordManager
+from .managers.timelapse_cache import TimelapseCache
 from .models.exceptions import LoginError
+from .services import async_setup_services
+from .views import async_setup as views_async_setup
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_setup(_hass, _config):
+async def async_setup(hass, _config):
+    async_setup_services(hass)
+    views_async_setup(hass)
+
     return True
 
 
@@ -85,3 +91,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     del hass.data[DOMAIN][entry.entry_id]
 
     return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove a config entry."""
+    _LOGGER.info(f"Removing {DOMAIN} integration, Entry ID: {entry.entry_id}")
+
+    await TimelapseCache.async_remove(hass, entry.entry_id)
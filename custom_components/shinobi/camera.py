@@ -76,7 +76,6 @@ class IntegrationCameraEntity(IntegrationBaseEntity, Camera, ABC):
 
         self._last_image = None
         self._last_url = None
-        self._snapshot_url = None
 
         config_data = coordinator.config_manager.config_data
 
@@ -94,13 +93,6 @@ class IntegrationCameraEntity(IntegrationBaseEntity, Camera, ABC):
         api = coordinator.api
 
         use_original_stream = config_manager.use_original_stream
-        snapshot = monitor.snapshot
-
-        if snapshot and snapshot.startswith("/"):
-            snapshot = snapshot[1:]
-
-        snapshot = api.build_url(f"{{base_url}}{snapshot}")
-
         stream_source = None
 
         if not use_original_stream:
@@ -117,7 +109,6 @@ class IntegrationCameraEntity(IntegrationBaseEntity, Camera, ABC):
 
         self._stream_source = stream_source
         self._attr_is_streaming = stream_source is not None
-        self._snapshot_url = snapshot
 
         if self._stream_source:
             self._attr_supported_features = CameraEntityFeature.STREAM
@@ -130,9 +121,9 @@ class IntegrationCameraEntity(IntegrationBaseEntity, Camera, ABC):
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return a still image response from the camera."""
-        api = self._local_coordinator.api
-
-        image = await api.get_snapshot(self._snapshot_url)
+        image = await self._local_coordinator.get_snapshot(
+            self.monitor_id, width, height
+        )
 
         return image
 
@@ -105,6 +105,7 @@ class IntegrationBaseEntity(CoordinatorEntity):
             self._attr_unique_id = unique_id
 
             self._data = {}
+            self._data_version = 0
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -124,7 +125,7 @@ class IntegrationBaseEntity(CoordinatorEntity):
 
     async def async_execute_device_action(self, key: str, *kwargs: Any):
         async_device_action = self._local_coordinator.get_device_action(
-            self._entity_description, self.monitor_id, key
+            self._entity_description, key
         )
 
         if self.monitor_id is None:
@@ -135,24 +136,42 @@ class IntegrationBaseEntity(CoordinatorEntity):
                 self._entity_description, self.monitor_id, *kwargs
             )
 
-        await self.coordinator.async_request_refresh()
+        self._local_coordinator.async_update_entities(
+            self.monitor_id, [self._entity_description.key]
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates of this entity's key and monitor."""
+        await super().async_added_to_hass()
+
+        self.async_on_remove(
+            self._local_coordinator.async_add_entity_listener(
+                self._entity_description,
+                self.monitor_id,
+                self._handle_coordinator_update,
+            )
+        )
+
+        self._handle_coordinator_update()
 
     def update_component(self, data):
         pass
 
+    @callback
     def _handle_coordinator_update(self) -> None:
         """Fetch new state parameters for the sensor."""
         try:
-            new_data = self._local_coordinator.get_data(
+            view = self._local_coordinator.get_view(
                 self._entity_description, self.monitor_id
             )
 
-            if self._data != new_data:
-                _LOGGER.debug(f"Data for {self.unique_id}: {new_data}")
+            if self._data_version != view.version:
+                _LOGGER.debug(f"Data for {self.unique_id}: {view.data}")
 
-                self.update_component(new_data)
+                self.update_component(view.data)
 
-                self._data = new_data
+                self._data = view.data
+                self._data_version = view.version
 
                 self.async_write_ha_state()
 
@@ -16,8 +16,10 @@ CONFIGURATION_FILE = f"{DOMAIN}.config.json"
 SIGNAL_MONITOR_DISCOVERED = f"{DOMAIN}_MONITOR_DISCOVERED_SIGNAL"
 SIGNAL_MONITOR_ADDED = f"{DOMAIN}_MONITOR_ADDED_SIGNAL"
 SIGNAL_MONITOR_UPDATED = f"{DOMAIN}_MONITOR_UPDATED_SIGNAL"
+SIGNAL_MONITOR_REMOVED = f"{DOMAIN}_MONITOR_REMOVED_SIGNAL"
 SIGNAL_MONITOR_STATUS_CHANGED = f"{DOMAIN}_MONITOR_STATUS_SIGNAL"
 SIGNAL_MONITOR_TRIGGER = f"{DOMAIN}_MONITOR_TRIGGERED_SIGNAL"
+SIGNAL_MONITOR_RECORDING_ADDED = f"{DOMAIN}_MONITOR_RECORDING_ADDED_SIGNAL"
 
 SIGNAL_SERVER_DISCOVERED = f"{DOMAIN}_SERVER_DISCOVERED_SIGNAL"
 SIGNAL_SERVER_ADDED = f"{DOMAIN}_SERVER_ADDED_SIGNAL"
@@ -45,6 +47,27 @@ DATA_KEY_MOTION_DETECTION = "motion_detector"
 DATA_KEY_SOUND_DETECTION = "sound_detector"
 DATA_KEY_ORIGINAL_STREAM = "use_original_stream"
 DATA_KEY_PROXY_RECORDINGS = "use_proxy_for_recordings"
+DATA_KEY_API_LATENCY = "api_latency"
+DATA_KEY_API_ERRORS = "api_errors"
+DATA_KEY_WS_EVENTS_RATE = "ws_events_rate"
+DATA_KEY_WS_HANDLER_TIME = "ws_handler_time"
+DIAGNOSTIC_DATA_KEYS = [
+    DATA_KEY_API_LATENCY,
+    DATA_KEY_API_ERRORS,
+    DATA_KEY_WS_EVENTS_RATE,
+    DATA_KEY_WS_HANDLER_TIME,
+]
+DATA_KEY_MAX_FRAME_SIZE = "max_frame_size"
+DATA_KEY_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DATA_KEY_MAX_CONNECTIONS_PER_HOST = "max_connections_per_host"
+DATA_KEY_SNAPSHOT_TTL = "snapshot_ttl"
+DATA_KEY_THUMBNAIL_TTL = "thumbnail_ttl"
+DATA_KEY_SNAPSHOT_CACHE_SIZE = "snapshot_cache_size"
+DATA_KEY_SNAPSHOT_PREFETCH_FRAMES = "snapshot_prefetch_frames"
+DATA_KEY_SNAPSHOT_PREFETCH_INTERVAL = "snapshot_prefetch_interval"
+DATA_KEY_PROXY_CHUNK_SIZE = "proxy_chunk_size"
+DATA_KEY_MAX_MEDIA_REQUESTS = "max_media_requests"
+DATA_KEY_TIMELAPSE_CACHE_SIZE = "timelapse_cache_size"
 DATA_KEY_EVENT_DURATION = "event_duration"
 DATA_KEY_EVENT_DURATION_MOTION = (
     f"{DATA_KEY_EVENT_DURATION}_{BinarySensorDeviceClass.MOTION}"
@@ -58,7 +81,6 @@ ATTR_IS_ON = "is_on"
 ATTR_DISABLED = "disabled"
 
 ATTR_ATTRIBUTES = "attributes"
-ATTR_ACTIONS = "actions"
 
 STORAGE_DATA_KEY = "key"
 
@@ -72,6 +94,12 @@ API_DATA_USER_ID = "user-id"
 API_DATA_GROUP_ID = "group-id"
 API_DATA_API_KEY = "api-key"
 API_DATA_LAST_UPDATE = "last-update"
+API_DATA_JSON_REPAIRS = "json-repairs"
+API_DATA_DROPPED_EVENTS = "dropped-events"
+API_DATA_BYTES_SAVED = "bytes-saved"
+API_DATA_UNCHANGED_RESPONSES = "unchanged-responses"
+API_DATA_LISTING_CACHE = "listing-cache"
+API_DATA_METRICS = "metrics"
 API_DATA_SOCKET_IO_VERSION = "socket-io-version"
 API_DATA_DAYS = "days"
 
@@ -92,14 +120,40 @@ SHINOBI_WS_PONG_MESSAGE = "3"
 SHINOBI_WS_CONNECTION_READY_MESSAGE = "40"
 SHINOBI_WS_ACTION_MESSAGE = "42"
 
+ENGINE_IO_PACKET_MESSAGE = "4"
+SOCKET_IO_NAMESPACE_PREFIX = "/"
+SOCKET_IO_NAMESPACE_SEPARATOR = ","
+
 UPDATE_API_INTERVAL = timedelta(seconds=30)
 HEARTBEAT_INTERVAL = timedelta(seconds=25)
-TRIGGER_INTERVAL = timedelta(seconds=1)
 WS_RECONNECT_INTERVAL = timedelta(seconds=30)
 API_RECONNECT_INTERVAL = timedelta(seconds=30)
-UPDATE_ENTITIES_INTERVAL = timedelta(seconds=1)
+LISTING_TTL_TODAY = timedelta(minutes=1)
+LISTING_TTL_PAST_DAY = timedelta(hours=1)
+MONITOR_DETAILS_MAX_AGE = timedelta(seconds=60)
 
 MAX_MSG_SIZE = 0
+DEFAULT_MAX_FRAME_SIZE = 1024 * 1024
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+DEFAULT_SNAPSHOT_TTL = 1
+DEFAULT_THUMBNAIL_TTL = 10
+DEFAULT_SNAPSHOT_CACHE_SIZE = 16 * 1024 * 1024
+DEFAULT_SNAPSHOT_PREFETCH_FRAMES = 1
+DEFAULT_SNAPSHOT_PREFETCH_INTERVAL = 1
+DEFAULT_PROXY_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_MEDIA_REQUESTS = 4
+DEFAULT_TIMELAPSE_CACHE_SIZE = 256 * 1024 * 1024
+SNAPSHOT_CONTENT_TYPE = "image/jpeg"
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+SNAPSHOT_VARIANT_SIZES = (160, 320, 640, 1280)
+SNAPSHOT_VARIANT_QUALITY = 80
+KEEPALIVE_TIMEOUT = timedelta(seconds=60)
+DNS_CACHE_TTL = timedelta(minutes=5)
+
+LATENCY_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+WS_TIMING_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50)
+WS_METRICS_RATE_WINDOW = timedelta(seconds=10)
 DISCONNECT_INTERVAL = 5
 
 URL_PARAMETER_BASE_URL = "base_url"
@@ -108,6 +162,9 @@ URL_PARAMETER_GROUP_ID = "group_id"
 URL_PARAMETER_MONITOR_ID = "monitor_id"
 URL_PARAMETER_VERSION = "version"
 
+URL_API_PREFIX = "{base_url}{api_key}"
+ACCEPT_ENCODING = "gzip, deflate"
+
 BASE_PROXY_URL = f"/api/{DOMAIN}"
 PROXY_PREFIX = f"/api/{DOMAIN}/{{entry_id:.+}}"
 
@@ -124,7 +181,15 @@ URL_API_KEYS = "{base_url}{api_key}/api/{group_id}/list"
 URL_UPDATE_MONITOR = "{base_url}{api_key}/configureMonitor/{group_id}/{monitor_id}"
 URL_TIME_LAPSE = "{base_url}{api_key}/timelapse/{group_id}/{monitor_id}"
 
-URL_UPDATE_MODE = f"{URL_MONITORS}/{{monitor_id}}"
+URL_MONITOR = f"{URL_MONITORS}/{{monitor_id}}"
+URL_UPDATE_MODE = f"{URL_MONITOR}/{{mode}}"
+URL_VIDEO_WALL_MONITOR_DATE = f"{URL_VIDEO_WALL_MONITOR}/{{date}}"
+URL_VIDEOS_SINCE = f"{URL_VIDEOS}?start={{start}}&noLimit=1"
+URL_VIDEOS_RANGE = (
+    f"{URL_VIDEOS}?start={{date}}T00:00:00&end={{date}}T23:59:59&noLimit=1"
+)
+URL_SNAPSHOT = "{base_url}{api_key}/jpeg/{group_id}/{monitor_id}/s.jpg"
+URL_TIME_LAPSE_FRAME = f"{URL_TIME_LAPSE}/{{date}}/{{file}}"
 
 LOGIN_USERNAME = "mail"
 LOGIN_PASSWORD = "pass"
@@ -144,6 +209,20 @@ ATTR_MONITOR_DETAILS = "details"
 ATTR_MONITOR_DETAILS_AUDIO_CODEC = "acodec"
 ATTR_MONITOR_DETAILS_DETECTOR = "detector"
 ATTR_MONITOR_DETAILS_DETECTOR_AUDIO = "detector_audio"
+
+SERVICE_SET_DETECTION = "set_detection"
+SERVICE_SET_MODE = "set_mode"
+
+ATTR_MONITORS = "monitors"
+ATTR_GROUP = "group"
+ATTR_MODE = "mode"
+ATTR_DETECTOR = "detector"
+ATTR_ENABLED = "enabled"
+
+MONITOR_DETECTORS = {
+    BinarySensorDeviceClass.MOTION: ATTR_MONITOR_DETAILS_DETECTOR,
+    BinarySensorDeviceClass.SOUND: ATTR_MONITOR_DETAILS_DETECTOR_AUDIO,
+}
 ATTR_MONITOR_MODE = "mode"
 ATTR_FPS = "fps"
 ATTR_STREAM_FPS = "fps"
@@ -160,7 +239,6 @@ TRIGGER_DETAILS_REASON = "reason"
 
 TRIGGER_PLUG_DB = "audio"
 
-TRIGGER_STATE = "state"
 TRIGGER_TIMESTAMP = "timestamp"
 
 MOTION_DETECTION = "Motion Detection"
@@ -176,11 +254,15 @@ PLUG_SENSOR_TYPE = {
     REASON_SOUND: BinarySensorDeviceClass.SOUND,
 }
 
+EVENT_TYPE_DATA_KEYS = {
+    BinarySensorDeviceClass.MOTION: DATA_KEY_MOTION,
+    BinarySensorDeviceClass.SOUND: DATA_KEY_SOUND,
+}
+
 SENSOR_AUTO_OFF_MOTION = timedelta(seconds=20)
 SENSOR_AUTO_OFF_SOUND = timedelta(seconds=10)
 
-TRIGGER_DEFAULT = {TRIGGER_STATE: False, TRIGGER_TIMESTAMP: 0}
-
+INVALID_JSON_PREFIX = '":'
 INVALID_JSON_FORMATS = {
     '":,"': '": null,"',
     '":.': '": 0.',
@@ -190,6 +272,8 @@ INVALID_JSON_FORMATS = {
 
 VIDEO_DETAILS_TIME = "time"
 VIDEO_DETAILS_EXTENSION = "ext"
+VIDEO_DETAILS_SIZE = "size"
+VIDEO_DETAILS_COUNT = "count"
 VIDEO_DETAILS_TIME_INVALID_CHAR = "z"
 
 VIDEO_DETAILS_TIME_FORMAT = "%X"
@@ -310,8 +394,11 @@ DETECTOR_SENSOR_ICONS = {
 WS_EVENT_LOG = "log"
 WS_EVENT_DETECTOR_TRIGGER = "detector_trigger"
 WS_EVENT_MONITOR_STATUS = "monitor_status"
+WS_EVENT_VIDEO_BUILD_SUCCESS = "video_build_success"
 WS_EVENT_DISK_USAGE = "diskUsed"
 WS_EVENT_OS = "os"
 WS_EVENT_ACTION_PING = "ping"
+WS_EVENT_UNKNOWN = "unknown"
+WS_EVENT_CONTROL = "control"
 
 TO_REDACT = ["mpass", "muser", "auto_host", "api-key", "username", "user-id"]
@@ -9,13 +9,15 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.components.camera import CameraEntityDescription
 from homeassistant.components.number import NumberEntityDescription
 from homeassistant.components.select import SelectEntityDescription
-from homeassistant.components.sensor import SensorEntityDescription
+from homeassistant.components.sensor import SensorEntityDescription, SensorStateClass
 from homeassistant.components.switch import SwitchEntityDescription
 from homeassistant.const import Platform, UnitOfTime
 from homeassistant.helpers.entity import EntityCategory, EntityDescription
 
 from ..models.monitor_data import MonitorData
 from .consts import (
+    DATA_KEY_API_ERRORS,
+    DATA_KEY_API_LATENCY,
     DATA_KEY_CAMERA,
     DATA_KEY_EVENT_DURATION_MOTION,
     DATA_KEY_EVENT_DURATION_SOUND,
@@ -27,6 +29,8 @@ from .consts import (
     DATA_KEY_PROXY_RECORDINGS,
     DATA_KEY_SOUND,
     DATA_KEY_SOUND_DETECTION,
+    DATA_KEY_WS_EVENTS_RATE,
+    DATA_KEY_WS_HANDLER_TIME,
 )
 from .enums import MonitorMode
 
@@ -156,6 +160,41 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         native_min_value=0,
         native_unit_of_measurement=UnitOfTime.SECONDS,
     ),
+    IntegrationSensorEntityDescription(
+        key=DATA_KEY_API_LATENCY,
+        name=DATA_KEY_API_LATENCY,
+        translation_key=DATA_KEY_API_LATENCY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        filter=lambda m: m is None,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    IntegrationSensorEntityDescription(
+        key=DATA_KEY_API_ERRORS,
+        name=DATA_KEY_API_ERRORS,
+        translation_key=DATA_KEY_API_ERRORS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        filter=lambda m: m is None,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    IntegrationSensorEntityDescription(
+        key=DATA_KEY_WS_EVENTS_RATE,
+        name=DATA_KEY_WS_EVENTS_RATE,
+        translation_key=DATA_KEY_WS_EVENTS_RATE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        filter=lambda m: m is None,
+        native_unit_of_measurement="frames/s",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    IntegrationSensorEntityDescription(
+        key=DATA_KEY_WS_HANDLER_TIME,
+        name=DATA_KEY_WS_HANDLER_TIME,
+        translation_key=DATA_KEY_WS_HANDLER_TIME,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        filter=lambda m: m is None,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
 ]
 
 
@@ -1,4 +1,4 @@
-from enum import Enum, StrEnum
+from enum import Enum, IntEnum, StrEnum
 
 
 class MonitorMode(StrEnum):
@@ -21,6 +21,12 @@ class MonitorMode(StrEnum):
         return icons.get(mode)
 
 
+class RequestPriority(IntEnum):
+    RECORDING = 0
+    SNAPSHOT = 1
+    THUMBNAIL = 2
+
+
 class RequestType(Enum):
     JSON = 0
     RESOURCE_CHECK = 1
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from io import BytesIO
+
+from PIL import Image
+
+from .consts import SNAPSHOT_VARIANT_QUALITY, SNAPSHOT_VARIANT_SIZES
+
+
+def get_variant_size(width: int | None, height: int | None) -> int | None:
+    """Smallest variant size fitting the requested size, None for the original."""
+    requested_size = max(width or 0, height or 0)
+
+    if requested_size == 0:
+        return None
+
+    index = bisect_left(SNAPSHOT_VARIANT_SIZES, requested_size)
+
+    if index == len(SNAPSHOT_VARIANT_SIZES):
+        return None
+
+    size = SNAPSHOT_VARIANT_SIZES[index]
+
+    return size
+
+
+def resize_jpeg(data: bytes, size: int) -> bytes:
+    """Downscale a JPEG to fit a size x size box, blocking, run in an executor.
+
+    Returns data as-is when the image already fits.
+    """
+    with Image.open(BytesIO(data)) as image:
+        if max(image.size) <= size:
+            return data
+
+        # Let the JPEG decoder skip the resolution that is not needed
+        image.draft("RGB", (size, size))
+        image.thumbnail((size, size))
+
+        output = BytesIO()
+
+        image.convert("RGB").save(
+            output, format="JPEG", quality=SNAPSHOT_VARIANT_QUALITY, optimize=True
+        )
+
+    result = output.getvalue()
+
+    return result
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+from .consts import INVALID_JSON_FORMATS, INVALID_JSON_PREFIX
+
+_INVALID_JSON_FORMATS_ORDERED = sorted(
+    INVALID_JSON_FORMATS.items(), key=lambda item: len(item[0]), reverse=True
+)
+
+
+def decode_json(data: str | bytes) -> tuple[Any, bool]:
+    """Decode JSON, repairing known Shinobi malformations only if parsing fails.
+
+    Returns the decoded payload and whether a repair was required.
+    """
+    try:
+        return orjson.loads(data), False
+
+    except orjson.JSONDecodeError:
+        if isinstance(data, bytes):
+            data = data.decode()
+
+        repaired_data = repair_json(data)
+
+        if repaired_data is data:
+            raise
+
+        return orjson.loads(repaired_data), True
+
+
+def repair_json(data: str) -> str:
+    """Fix INVALID_JSON_FORMATS in a single pass, returns data as-is if valid."""
+    parts = []
+    last_position = 0
+    position = data.find(INVALID_JSON_PREFIX)
+
+    while position != -1:
+        next_position = position + 1
+
+        for bad_format, fixed_format in _INVALID_JSON_FORMATS_ORDERED:
+            if data.startswith(bad_format, position):
+                parts.append(data[last_position:position])
+                parts.append(fixed_format)
+
+                last_position = next_position = position + len(bad_format)
+                break
+
+        position = data.find(INVALID_JSON_PREFIX, next_position)
+
+    if not parts:
+        return data
+
+    parts.append(data[last_position:])
+
+    result = "".join(parts)
+
+    return result
@@ -59,6 +59,10 @@ def _async_get_diagnostics(
         data["config"] = debug_data["config"]
         data["api"] = debug_data["api"]
         data["websockets"] = debug_data["websockets"]
+        data["api_metrics"] = debug_data["api_metrics"]
+        data["snapshot_cache"] = debug_data["snapshot_cache"]
+        data["timelapse_cache"] = debug_data["timelapse_cache"]
+        data["request_limiter"] = debug_data["request_limiter"]
 
         monitors_data = [
             monitor.to_dict()
@@ -81,6 +85,10 @@ def _async_get_diagnostics(
             "config": debug_data["config"],
             "api": debug_data["api"],
             "websockets": debug_data["websockets"],
+            "api_metrics": debug_data["api_metrics"],
+            "snapshot_cache": debug_data["snapshot_cache"],
+            "timelapse_cache": debug_data["timelapse_cache"],
+            "request_limiter": debug_data["request_limiter"],
         }
 
         data.update(
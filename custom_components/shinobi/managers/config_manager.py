@@ -16,10 +16,32 @@ from homeassistant.helpers.storage import Store
 from ..common.consts import (
     CONFIGURATION_FILE,
     DATA_KEY_EVENT_DURATION,
+    DATA_KEY_MAX_CONCURRENT_REQUESTS,
+    DATA_KEY_MAX_CONNECTIONS_PER_HOST,
+    DATA_KEY_MAX_FRAME_SIZE,
+    DATA_KEY_MAX_MEDIA_REQUESTS,
     DATA_KEY_ORIGINAL_STREAM,
+    DATA_KEY_PROXY_CHUNK_SIZE,
     DATA_KEY_PROXY_RECORDINGS,
+    DATA_KEY_SNAPSHOT_CACHE_SIZE,
+    DATA_KEY_SNAPSHOT_PREFETCH_FRAMES,
+    DATA_KEY_SNAPSHOT_PREFETCH_INTERVAL,
+    DATA_KEY_SNAPSHOT_TTL,
+    DATA_KEY_THUMBNAIL_TTL,
+    DATA_KEY_TIMELAPSE_CACHE_SIZE,
     DEFAULT_ENTRY_ID,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_MAX_FRAME_SIZE,
+    DEFAULT_MAX_MEDIA_REQUESTS,
     DEFAULT_NAME,
+    DEFAULT_PROXY_CHUNK_SIZE,
+    DEFAULT_SNAPSHOT_CACHE_SIZE,
+    DEFAULT_SNAPSHOT_PREFETCH_FRAMES,
+    DEFAULT_SNAPSHOT_PREFETCH_INTERVAL,
+    DEFAULT_SNAPSHOT_TTL,
+    DEFAULT_THUMBNAIL_TTL,
+    DEFAULT_TIMELAPSE_CACHE_SIZE,
     DOMAIN,
     INVALID_TOKEN_SECTION,
     SENSOR_AUTO_OFF_MOTION,
@@ -107,6 +129,88 @@ class ConfigManager:
 
         return event_duration
 
+    @property
+    def max_frame_size(self) -> int:
+        max_frame_size = self._data.get(DATA_KEY_MAX_FRAME_SIZE, DEFAULT_MAX_FRAME_SIZE)
+
+        return max_frame_size
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        max_concurrent_requests = self._data.get(
+            DATA_KEY_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+        )
+
+        return max_concurrent_requests
+
+    @property
+    def max_connections_per_host(self) -> int:
+        max_connections_per_host = self._data.get(
+            DATA_KEY_MAX_CONNECTIONS_PER_HOST, DEFAULT_MAX_CONNECTIONS_PER_HOST
+        )
+
+        return max_connections_per_host
+
+    @property
+    def snapshot_ttl(self) -> float:
+        snapshot_ttl = self._data.get(DATA_KEY_SNAPSHOT_TTL, DEFAULT_SNAPSHOT_TTL)
+
+        return snapshot_ttl
+
+    @property
+    def snapshot_cache_size(self) -> int:
+        snapshot_cache_size = self._data.get(
+            DATA_KEY_SNAPSHOT_CACHE_SIZE, DEFAULT_SNAPSHOT_CACHE_SIZE
+        )
+
+        return snapshot_cache_size
+
+    @property
+    def snapshot_prefetch_frames(self) -> int:
+        snapshot_prefetch_frames = self._data.get(
+            DATA_KEY_SNAPSHOT_PREFETCH_FRAMES, DEFAULT_SNAPSHOT_PREFETCH_FRAMES
+        )
+
+        return snapshot_prefetch_frames
+
+    @property
+    def snapshot_prefetch_interval(self) -> float:
+        snapshot_prefetch_interval = self._data.get(
+            DATA_KEY_SNAPSHOT_PREFETCH_INTERVAL, DEFAULT_SNAPSHOT_PREFETCH_INTERVAL
+        )
+
+        return snapshot_prefetch_interval
+
+    @property
+    def max_media_requests(self) -> int:
+        max_media_requests = self._data.get(
+            DATA_KEY_MAX_MEDIA_REQUESTS, DEFAULT_MAX_MEDIA_REQUESTS
+        )
+
+        return max_media_requests
+
+    @property
+    def proxy_chunk_size(self) -> int:
+        proxy_chunk_size = self._data.get(
+            DATA_KEY_PROXY_CHUNK_SIZE, DEFAULT_PROXY_CHUNK_SIZE
+        )
+
+        return proxy_chunk_size
+
+    @property
+    def timelapse_cache_size(self) -> int:
+        timelapse_cache_size = self._data.get(
+            DATA_KEY_TIMELAPSE_CACHE_SIZE, DEFAULT_TIMELAPSE_CACHE_SIZE
+        )
+
+        return timelapse_cache_size
+
+    @property
+    def thumbnail_ttl(self) -> float:
+        thumbnail_ttl = self._data.get(DATA_KEY_THUMBNAIL_TTL, DEFAULT_THUMBNAIL_TTL)
+
+        return thumbnail_ttl
+
     @property
     def config_data(self) -> ConfigData:
         config_data = self._config_data
@@ -258,6 +362,17 @@ class ConfigManager:
         data = {
             DATA_KEY_ORIGINAL_STREAM: False,
             DATA_KEY_PROXY_RECORDINGS: False,
+            DATA_KEY_MAX_FRAME_SIZE: DEFAULT_MAX_FRAME_SIZE,
+            DATA_KEY_MAX_CONCURRENT_REQUESTS: DEFAULT_MAX_CONCURRENT_REQUESTS,
+            DATA_KEY_MAX_CONNECTIONS_PER_HOST: DEFAULT_MAX_CONNECTIONS_PER_HOST,
+            DATA_KEY_SNAPSHOT_TTL: DEFAULT_SNAPSHOT_TTL,
+            DATA_KEY_SNAPSHOT_CACHE_SIZE: DEFAULT_SNAPSHOT_CACHE_SIZE,
+            DATA_KEY_SNAPSHOT_PREFETCH_FRAMES: DEFAULT_SNAPSHOT_PREFETCH_FRAMES,
+            DATA_KEY_SNAPSHOT_PREFETCH_INTERVAL: DEFAULT_SNAPSHOT_PREFETCH_INTERVAL,
+            DATA_KEY_PROXY_CHUNK_SIZE: DEFAULT_PROXY_CHUNK_SIZE,
+            DATA_KEY_MAX_MEDIA_REQUESTS: DEFAULT_MAX_MEDIA_REQUESTS,
+            DATA_KEY_TIMELAPSE_CACHE_SIZE: DEFAULT_TIMELAPSE_CACHE_SIZE,
+            DATA_KEY_THUMBNAIL_TTL: DEFAULT_THUMBNAIL_TTL,
             DATA_KEY_EVENT_DURATION: {
                 BinarySensorDeviceClass.MOTION: int(
                     SENSOR_AUTO_OFF_MOTION.total_seconds()
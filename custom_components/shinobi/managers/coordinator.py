@@ -4,15 +4,21 @@ import logging
 import sys
 from typing import Callable
 
+from aiohttp import ClientSession, TCPConnector
+from aiohttp.hdrs import USER_AGENT
+
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
-from homeassistant.const import ATTR_ICON, ATTR_STATE
-from homeassistant.core import Event, callback
+from homeassistant.const import ATTR_ICON, ATTR_STATE, EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import slugify
 
 from ..common.connectivity_status import ConnectivityStatus
@@ -22,10 +28,11 @@ from ..common.consts import (
     ACTION_ENTITY_TURN_OFF,
     ACTION_ENTITY_TURN_ON,
     API_RECONNECT_INTERVAL,
-    ATTR_ACTIONS,
     ATTR_IS_ON,
     ATTR_MONITOR_GROUP_ID,
     ATTR_MONITOR_ID,
+    DATA_KEY_API_ERRORS,
+    DATA_KEY_API_LATENCY,
     DATA_KEY_CAMERA,
     DATA_KEY_EVENT_DURATION_MOTION,
     DATA_KEY_EVENT_DURATION_SOUND,
@@ -37,11 +44,20 @@ from ..common.consts import (
     DATA_KEY_PROXY_RECORDINGS,
     DATA_KEY_SOUND,
     DATA_KEY_SOUND_DETECTION,
+    DATA_KEY_WS_EVENTS_RATE,
+    DATA_KEY_WS_HANDLER_TIME,
     DEFAULT_NAME,
+    DIAGNOSTIC_DATA_KEYS,
+    DNS_CACHE_TTL,
     DOMAIN,
+    EVENT_TYPE_DATA_KEYS,
+    KEEPALIVE_TIMEOUT,
+    LATENCY_BUCKETS,
     SIGNAL_API_STATUS,
     SIGNAL_MONITOR_ADDED,
     SIGNAL_MONITOR_DISCOVERED,
+    SIGNAL_MONITOR_RECORDING_ADDED,
+    SIGNAL_MONITOR_REMOVED,
     SIGNAL_MONITOR_STATUS_CHANGED,
     SIGNAL_MONITOR_TRIGGER,
     SIGNAL_MONITOR_UPDATED,
@@ -50,15 +66,20 @@ from ..common.consts import (
     SIGNAL_WS_READY,
     SIGNAL_WS_STATUS,
     UPDATE_API_INTERVAL,
-    UPDATE_ENTITIES_INTERVAL,
     WS_RECONNECT_INTERVAL,
+    WS_TIMING_BUCKETS,
 )
 from ..common.entity_descriptions import PLATFORMS, IntegrationEntityDescription
 from ..common.enums import MonitorMode
+from ..models.entity_view import EntityView
+from ..models.histogram import Histogram
 from ..models.monitor_data import MonitorData
-from ..views import async_setup as views_async_setup
+from ..models.snapshot_cache_item import SnapshotCacheItem
 from .config_manager import ConfigManager
+from .request_limiter import RequestLimiter
 from .rest_api import RestAPI
+from .snapshot_cache import SnapshotCache
+from .timelapse_cache import TimelapseCache
 from .websockets import WebSockets
 
 _LOGGER = logging.getLogger(__name__)
@@ -67,7 +88,11 @@ _LOGGER = logging.getLogger(__name__)
 class Coordinator(DataUpdateCoordinator):
     """My custom coordinator."""
 
+    _session: ClientSession
     _api: RestAPI
+    _request_limiter: RequestLimiter
+    _snapshot_cache: SnapshotCache
+    _timelapse_cache: TimelapseCache
     _websockets: WebSockets | None
 
     _data_mapping: dict[
@@ -77,9 +102,13 @@ class Coordinator(DataUpdateCoordinator):
     ] | None
     _system_status_details: dict | None
 
-    _last_update: float
-    _last_heartbeat: float
+    _remove_api_update_listener: CALLBACK_TYPE | None
+    _remove_close_listener: CALLBACK_TYPE | None
     _monitors = dict[str, MonitorData]
+    _views: dict[str | None, dict[str, EntityView]]
+    _actions_mapping: dict[str, dict[str, Callable]] | None
+    _api_latency: Histogram
+    _ws_handler_time: Histogram
 
     def __init__(self, hass, config_manager: ConfigManager):
         """Initialize my coordinator."""
@@ -87,21 +116,37 @@ class Coordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=config_manager.entry_title,
-            update_interval=UPDATE_ENTITIES_INTERVAL,
+            update_interval=None,
             update_method=self._async_update_data,
             config_entry=config_manager.entry,
         )
 
-        self._api = RestAPI(hass, config_manager)
-        self._websockets = WebSockets(hass, config_manager)
+        self._session = self._create_session(config_manager)
+        self._remove_close_listener = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._on_home_assistant_close
+        )
+
+        self._api = RestAPI(hass, config_manager, self._session)
+        self._websockets = WebSockets(hass, config_manager, self._session)
+        self._request_limiter = RequestLimiter(config_manager.max_media_requests)
+
+        self._snapshot_cache = SnapshotCache(
+            hass, config_manager, self._api, self._request_limiter
+        )
+        self._timelapse_cache = TimelapseCache(
+            hass, config_manager, self._api, self._request_limiter
+        )
 
         self._config_manager = config_manager
 
         self._data_mapping = None
 
-        self._last_update = 0
-        self._last_heartbeat = 0
+        self._remove_api_update_listener = None
         self._monitors = {}
+        self._views = {}
+        self._actions_mapping = None
+        self._api_latency = Histogram(LATENCY_BUCKETS)
+        self._ws_handler_time = Histogram(WS_TIMING_BUCKETS)
 
         self._load_signal_handlers()
 
@@ -111,6 +156,18 @@ class Coordinator(DataUpdateCoordinator):
 
         return monitors
 
+    @property
+    def session(self) -> ClientSession:
+        session = self._session
+
+        return session
+
+    @property
+    def request_limiter(self) -> RequestLimiter:
+        request_limiter = self._request_limiter
+
+        return request_limiter
+
     @property
     def api(self) -> RestAPI:
         api = self._api
@@ -132,6 +189,12 @@ class Coordinator(DataUpdateCoordinator):
     async def on_home_assistant_start(self, _event_data: Event):
         await self.initialize()
 
+    async def _on_home_assistant_close(self, _event_data: Event):
+        """Entries are not unloaded on shutdown, the session is closed here."""
+        self._remove_close_listener = None
+
+        await self._session.close()
+
     def _load_signal_handlers(self):
         loop = self.hass.loop
 
@@ -151,6 +214,10 @@ class Coordinator(DataUpdateCoordinator):
         def on_monitor_updated(entry_id: str, monitor: MonitorData):
             loop.create_task(self._on_monitor_updated(entry_id, monitor))
 
+        @callback
+        def on_monitor_removed(entry_id: str, monitor_id: str):
+            loop.create_task(self._on_monitor_removed(entry_id, monitor_id))
+
         @callback
         def on_monitor_triggered(
             entry_id: str, monitor_id: str, event_type: str, value
@@ -165,6 +232,10 @@ class Coordinator(DataUpdateCoordinator):
                 self._on_monitor_status_changed(entry_id, monitor_id, status_code)
             )
 
+        @callback
+        def on_monitor_recording_added(entry_id: str, monitor_id: str):
+            loop.create_task(self._on_monitor_recording_added(entry_id, monitor_id))
+
         @callback
         def on_server_discovered(entry_id: str):
             loop.create_task(self._on_server_discovered(entry_id))
@@ -178,8 +249,10 @@ class Coordinator(DataUpdateCoordinator):
             SIGNAL_WS_STATUS: on_ws_status_changed,
             SIGNAL_MONITOR_DISCOVERED: on_monitor_discovered,
             SIGNAL_MONITOR_UPDATED: on_monitor_updated,
+            SIGNAL_MONITOR_REMOVED: on_monitor_removed,
             SIGNAL_MONITOR_TRIGGER: on_monitor_triggered,
             SIGNAL_MONITOR_STATUS_CHANGED: on_monitor_status_changed,
+            SIGNAL_MONITOR_RECORDING_ADDED: on_monitor_recording_added,
             SIGNAL_SERVER_DISCOVERED: on_server_discovered,
             SIGNAL_WS_READY: on_ws_ready,
         }
@@ -197,18 +270,50 @@ class Coordinator(DataUpdateCoordinator):
         _LOGGER.info(f"Start loading {DOMAIN} integration, Entry ID: {entry.entry_id}")
 
         self._build_data_mapping()
+        self._build_actions_mapping()
+
+        await self._timelapse_cache.initialize()
 
         await self.hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-        views_async_setup(self.hass, self._config_manager)
+        self._remove_api_update_listener = async_track_time_interval(
+            self.hass, self._async_update_api, UPDATE_API_INTERVAL
+        )
 
         await self.async_request_refresh()
 
         await self._api.initialize()
 
     async def terminate(self):
+        self._stop_api_updates()
+
         await self._websockets.terminate()
 
+        self._snapshot_cache.clear()
+        self._timelapse_cache.clear()
+
+        if self._remove_close_listener is not None:
+            self._remove_close_listener()
+            self._remove_close_listener = None
+
+        await self._session.close()
+
+    @staticmethod
+    def _create_session(config_manager: ConfigManager) -> ClientSession:
+        """Session with a connection pool kept alive for the whole entry lifetime."""
+        connector = TCPConnector(
+            limit_per_host=config_manager.max_connections_per_host,
+            ttl_dns_cache=int(DNS_CACHE_TTL.total_seconds()),
+            keepalive_timeout=KEEPALIVE_TIMEOUT.total_seconds(),
+            enable_cleanup_closed=True,
+        )
+
+        session = ClientSession(
+            connector=connector, headers={USER_AGENT: SERVER_SOFTWARE}
+        )
+
+        return session
+
     def get_debug_data(self) -> dict:
         config_data = self._config_manager.get_debug_data()
 
@@ -217,6 +322,13 @@ class Coordinator(DataUpdateCoordinator):
             "config": config_data,
             "api": self._api.data,
             "websockets": self._websockets.data,
+            "snapshot_cache": self._snapshot_cache.data,
+            "timelapse_cache": self._timelapse_cache.data,
+            "request_limiter": self._request_limiter.data,
+            "api_metrics": {
+                endpoint: metrics.to_dict()
+                for endpoint, metrics in self._api.endpoint_metrics.items()
+            },
         }
 
         return data
@@ -271,9 +383,79 @@ class Coordinator(DataUpdateCoordinator):
 
         return device_info
 
+    async def set_detection(
+        self, monitor_ids: list[str], detector: str, enabled: bool
+    ) -> dict[str, bool]:
+        _LOGGER.debug(
+            f"Set {detector} of monitors {', '.join(monitor_ids)} to {enabled}"
+        )
+
+        results = await self._api.set_detection(monitor_ids, detector, enabled)
+
+        return results
+
+    async def set_monitors_mode(
+        self, monitor_ids: list[str], mode: str
+    ) -> dict[str, bool]:
+        _LOGGER.debug(f"Set mode of monitors {', '.join(monitor_ids)} to {mode}")
+
+        results = await self._api.set_monitors_mode(monitor_ids, mode)
+
+        await self._api.update()
+
+        return results
+
+    def get_snapshot_url(self, monitor_id: str) -> str | None:
+        monitor = self._monitors.get(monitor_id)
+
+        if monitor is None:
+            return None
+
+        snapshot = monitor.snapshot
+
+        if snapshot and snapshot.startswith("/"):
+            snapshot = snapshot[1:]
+
+        url = self._api.build_url(f"{{base_url}}{snapshot}")
+
+        return url
+
+    async def get_snapshot(
+        self, monitor_id: str, width: int | None = None, height: int | None = None
+    ) -> bytes | None:
+        url = self.get_snapshot_url(monitor_id)
+
+        if url is None:
+            return None
+
+        image = await self._snapshot_cache.get(monitor_id, url, width, height)
+
+        return image
+
+    async def get_thumbnail(self, monitor_id: str) -> SnapshotCacheItem | None:
+        """Cached snapshot of the monitor, kept for the thumbnail TTL."""
+        url = self.get_snapshot_url(monitor_id)
+
+        if url is None:
+            return None
+
+        item = await self._snapshot_cache.get_item(
+            monitor_id, url, self._config_manager.thumbnail_ttl
+        )
+
+        return item
+
+    async def get_timelapse_frame(
+        self, monitor_id: str, date: str, file: str
+    ) -> bytes | None:
+        """Timelapse frame from the disk cache."""
+        data = await self._timelapse_cache.get(monitor_id, date, file)
+
+        return data
+
     async def get_video_wall(self) -> list[dict] | None:
         if self._api.support_video_browser_api:
-            result = self._api.get_video_wall()
+            result = await self._api.get_video_wall()
 
         else:
             result = [
@@ -286,6 +468,60 @@ class Coordinator(DataUpdateCoordinator):
 
         return result
 
+    def get_view(
+        self,
+        entity_description: IntegrationEntityDescription,
+        monitor_id: str | None = None,
+    ) -> EntityView:
+        monitor_views = self._views.setdefault(monitor_id, {})
+        view = monitor_views.get(entity_description.key)
+
+        if view is None:
+            view = EntityView(entity_description, monitor_id)
+            view.update(self._get_view_data(view))
+
+            monitor_views[entity_description.key] = view
+
+        return view
+
+    @callback
+    def async_add_entity_listener(
+        self,
+        entity_description: IntegrationEntityDescription,
+        monitor_id: str | None,
+        update_callback: CALLBACK_TYPE,
+    ) -> CALLBACK_TYPE:
+        """Listen for updates of a single entity key of a monitor (or the server)."""
+        view = self.get_view(entity_description, monitor_id)
+        view.listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            view.listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update_entities(
+        self, monitor_id: str | None, keys: list[str] | None = None
+    ) -> None:
+        """Update entities of a monitor (or the server), all keys if not specified."""
+        monitor_views = self._views.get(monitor_id)
+
+        if monitor_views is None:
+            return
+
+        views = (
+            list(monitor_views.values())
+            if keys is None
+            else [monitor_views[key] for key in keys if key in monitor_views]
+        )
+
+        for view in views:
+            if view.update(self._get_view_data(view)):
+                for update_callback in list(view.listeners):
+                    update_callback()
+
     async def _on_api_status_changed(self, entry_id: str, status: ConnectivityStatus):
         if entry_id != self._config_manager.entry_id:
             return
@@ -305,7 +541,7 @@ class Coordinator(DataUpdateCoordinator):
             await self._api.initialize()
 
         elif status == ConnectivityStatus.InvalidCredentials:
-            self.update_interval = None
+            self._stop_api_updates()
 
     async def _on_ws_status_changed(self, entry_id: str, status: ConnectivityStatus):
         if entry_id != self._config_manager.entry_id:
@@ -341,6 +577,26 @@ class Coordinator(DataUpdateCoordinator):
         if entry_id == self.config_manager.entry_id:
             self._monitors[monitor.id] = monitor
 
+            self.async_update_entities(monitor.id)
+
+    async def _on_monitor_removed(self, entry_id: str, monitor_id: str):
+        if entry_id == self.config_manager.entry_id:
+            monitor = self._monitors.pop(monitor_id, None)
+
+            self._views.pop(monitor_id, None)
+            self._snapshot_cache.remove(monitor_id)
+
+            if monitor is not None:
+                identifiers = self.get_monitor_identifiers(monitor)
+
+                device_registry = dr.async_get(self.hass)
+                device = device_registry.async_get_device(identifiers=identifiers)
+
+                if device is not None:
+                    _LOGGER.info(f"Removing device of monitor '{monitor_id}'")
+
+                    device_registry.async_remove_device(device.id)
+
     async def _on_monitor_triggered(
         self, entry_id: str, monitor_id: str, event_type: str, value
     ):
@@ -348,7 +604,17 @@ class Coordinator(DataUpdateCoordinator):
             _LOGGER.debug(
                 f"Monitor '{monitor_id}' triggered with event {event_type}: {value}"
             )
-            await self.async_request_refresh()
+
+            if value:
+                url = self.get_snapshot_url(monitor_id)
+
+                if url is not None:
+                    self._snapshot_cache.prefetch(monitor_id, url)
+
+            key = EVENT_TYPE_DATA_KEYS.get(event_type)
+
+            if key is not None:
+                self.async_update_entities(monitor_id, [key])
 
     async def _on_monitor_status_changed(
         self, entry_id: str, monitor_id: str, status_code: int
@@ -361,14 +627,19 @@ class Coordinator(DataUpdateCoordinator):
 
                 self._monitors[monitor.id] = monitor
 
-                await self.async_request_refresh()
+                self.async_update_entities(monitor_id)
+
+    async def _on_monitor_recording_added(self, entry_id: str, monitor_id: str):
+        if entry_id == self.config_manager.entry_id:
+            _LOGGER.debug(f"Monitor '{monitor_id}' recording added")
+
+            self._api.invalidate_listings(monitor_id)
 
     async def _async_update_data(self):
-        """Fetch parameters from API endpoint.
+        """Entities are updated by push, REST data is refreshed by _async_update_api."""
+        return {}
 
-        This is the place to pre-process the parameters to lookup tables
-        so entities can quickly look up their parameters.
-        """
+    async def _async_update_api(self, _now: datetime):
         try:
             api_connected = self._api.status == ConnectivityStatus.Connected
             aws_client_connected = (
@@ -378,17 +649,34 @@ class Coordinator(DataUpdateCoordinator):
             is_ready = api_connected and aws_client_connected
 
             if is_ready:
-                now = datetime.now().timestamp()
+                await self._api.update()
 
-                if now - self._last_update >= UPDATE_API_INTERVAL.total_seconds():
-                    await self._api.update()
+            self._swap_metrics_windows()
 
-                    self._last_update = now
+            self.async_update_entities(None, DIAGNOSTIC_DATA_KEYS)
 
-            return {}
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to update data from API, Error: {ex}, Line: {line_number}"
+            )
+
+    def _swap_metrics_windows(self):
+        """Diagnostic sensors show the last update interval, not all history."""
+        api_latency = Histogram(LATENCY_BUCKETS)
+
+        for metrics in self._api.endpoint_metrics.values():
+            api_latency.merge(metrics.swap_window())
 
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}")
+        self._api_latency = api_latency
+        self._ws_handler_time = self._websockets.metrics.swap_handler_time_window()
+
+    def _stop_api_updates(self):
+        if self._remove_api_update_listener is not None:
+            self._remove_api_update_listener()
+            self._remove_api_update_listener = None
 
     def _build_data_mapping(self):
         data_mapping = {
@@ -403,18 +691,59 @@ class Coordinator(DataUpdateCoordinator):
             DATA_KEY_PROXY_RECORDINGS: self._get_proxy_for_recordings_data,
             DATA_KEY_EVENT_DURATION_MOTION: self._get_event_duration_motion_data,
             DATA_KEY_EVENT_DURATION_SOUND: self._get_event_duration_sound_data,
+            DATA_KEY_API_LATENCY: self._get_api_latency_data,
+            DATA_KEY_API_ERRORS: self._get_api_errors_data,
+            DATA_KEY_WS_EVENTS_RATE: self._get_ws_events_rate_data,
+            DATA_KEY_WS_HANDLER_TIME: self._get_ws_handler_time_data,
         }
 
         self._data_mapping = data_mapping
 
         _LOGGER.debug(f"Data retrieval mapping created, Mapping: {self._data_mapping}")
 
+    def _build_actions_mapping(self):
+        actions_mapping = {
+            DATA_KEY_MONITOR_MODE: {
+                ACTION_ENTITY_SELECT_OPTION: self._set_monitor_mode,
+            },
+            DATA_KEY_MOTION_DETECTION: {
+                ACTION_ENTITY_TURN_ON: self._set_motion_detection_enabled,
+                ACTION_ENTITY_TURN_OFF: self._set_motion_detection_disabled,
+            },
+            DATA_KEY_SOUND_DETECTION: {
+                ACTION_ENTITY_TURN_ON: self._set_sound_detection_enabled,
+                ACTION_ENTITY_TURN_OFF: self._set_sound_detection_disabled,
+            },
+            DATA_KEY_ORIGINAL_STREAM: {
+                ACTION_ENTITY_TURN_ON: self._set_original_stream_enabled,
+                ACTION_ENTITY_TURN_OFF: self._set_original_stream_disabled,
+            },
+            DATA_KEY_PROXY_RECORDINGS: {
+                ACTION_ENTITY_TURN_ON: self._set_proxy_for_recordings_enabled,
+                ACTION_ENTITY_TURN_OFF: self._set_proxy_for_recordings_disabled,
+            },
+            DATA_KEY_EVENT_DURATION_MOTION: {
+                ACTION_ENTITY_SET_NATIVE_VALUE: self._set_event_duration,
+            },
+            DATA_KEY_EVENT_DURATION_SOUND: {
+                ACTION_ENTITY_SET_NATIVE_VALUE: self._set_event_duration,
+            },
+        }
+
+        self._actions_mapping = actions_mapping
+
     def get_data(
         self,
         entity_description: IntegrationEntityDescription,
         monitor_id: str | None = None,
     ) -> dict | None:
+        view = self.get_view(entity_description, monitor_id)
+
+        return view.data
+
+    def _get_view_data(self, view: EntityView) -> dict | None:
         result = None
+        entity_description = view.entity_description
 
         try:
             handler = self._data_mapping.get(entity_description.key)
@@ -425,11 +754,11 @@ class Coordinator(DataUpdateCoordinator):
                 )
 
             else:
-                if monitor_id is None:
+                if view.monitor_id is None:
                     result = handler(entity_description)
 
                 else:
-                    result = handler(entity_description, monitor_id)
+                    result = handler(entity_description, view.monitor_id)
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -444,12 +773,9 @@ class Coordinator(DataUpdateCoordinator):
     def get_device_action(
         self,
         entity_description: IntegrationEntityDescription,
-        monitor_id: str | None,
         action_key: str,
     ) -> Callable:
-        device_data = self.get_data(entity_description, monitor_id)
-
-        actions = device_data.get(ATTR_ACTIONS)
+        actions = self._actions_mapping.get(entity_description.key, {})
         async_action = actions.get(action_key)
 
         return async_action
@@ -469,7 +795,6 @@ class Coordinator(DataUpdateCoordinator):
         result = {
             ATTR_STATE: mode,
             ATTR_ICON: icon,
-            ATTR_ACTIONS: {ACTION_ENTITY_SELECT_OPTION: self._set_monitor_mode},
         }
 
         return result
@@ -528,10 +853,6 @@ class Coordinator(DataUpdateCoordinator):
         result = {
             ATTR_IS_ON: is_on,
             ATTR_ICON: icon,
-            ATTR_ACTIONS: {
-                ACTION_ENTITY_TURN_ON: self._set_motion_detection_enabled,
-                ACTION_ENTITY_TURN_OFF: self._set_motion_detection_disabled,
-            },
         }
 
         return result
@@ -547,10 +868,6 @@ class Coordinator(DataUpdateCoordinator):
         result = {
             ATTR_IS_ON: is_on,
             ATTR_ICON: icon,
-            ATTR_ACTIONS: {
-                ACTION_ENTITY_TURN_ON: self._set_sound_detection_enabled,
-                ACTION_ENTITY_TURN_OFF: self._set_sound_detection_disabled,
-            },
         }
 
         return result
@@ -560,10 +877,6 @@ class Coordinator(DataUpdateCoordinator):
 
         result = {
             ATTR_IS_ON: is_on,
-            ATTR_ACTIONS: {
-                ACTION_ENTITY_TURN_ON: self._set_original_stream_enabled,
-                ACTION_ENTITY_TURN_OFF: self._set_original_stream_disabled,
-            },
         }
 
         return result
@@ -573,10 +886,43 @@ class Coordinator(DataUpdateCoordinator):
 
         result = {
             ATTR_IS_ON: is_on,
-            ATTR_ACTIONS: {
-                ACTION_ENTITY_TURN_ON: self._set_proxy_for_recordings_enabled,
-                ACTION_ENTITY_TURN_OFF: self._set_proxy_for_recordings_disabled,
-            },
+        }
+
+        return result
+
+    def _get_api_latency_data(self, _entity_description) -> dict | None:
+        """p95 of the last update interval, the breakdown is in diagnostics."""
+        result = {
+            ATTR_STATE: self._api_latency.percentile(95),
+        }
+
+        return result
+
+    def _get_api_errors_data(self, _entity_description) -> dict | None:
+        failures = sum(
+            metrics.failures for metrics in self._api.endpoint_metrics.values()
+        )
+
+        result = {
+            ATTR_STATE: failures,
+        }
+
+        return result
+
+    def _get_ws_events_rate_data(self, _entity_description) -> dict | None:
+        """Counters per event type are in diagnostics."""
+        metrics = self._websockets.metrics
+
+        result = {
+            ATTR_STATE: round(metrics.frames_per_second, 2),
+        }
+
+        return result
+
+    def _get_ws_handler_time_data(self, _entity_description) -> dict | None:
+        """p95 of the last update interval, the breakdown is in diagnostics."""
+        result = {
+            ATTR_STATE: self._ws_handler_time.percentile(95),
         }
 
         return result
@@ -602,9 +948,6 @@ class Coordinator(DataUpdateCoordinator):
 
         result = {
             ATTR_STATE: state,
-            ATTR_ACTIONS: {
-                ACTION_ENTITY_SET_NATIVE_VALUE: self._set_event_duration,
-            },
         }
 
         return result
@@ -616,6 +959,8 @@ class Coordinator(DataUpdateCoordinator):
 
         await self._api.set_monitor_mode(monitor_id, option)
 
+        await self._api.update_monitor_details(monitor_id)
+
     async def _set_motion_detection_enabled(self, _entity_description, monitor_id: str):
         _LOGGER.debug(f"Enable monitor {monitor_id} Motion Detection")
 
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from asyncio import CancelledError, Future, get_running_loop
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from heapq import heappop, heappush
+from itertools import count
+import logging
+from time import monotonic
+
+from ..common.consts import LATENCY_BUCKETS
+from ..common.enums import RequestPriority
+from ..models.histogram import Histogram
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RequestLimiter:
+    """Concurrent media requests of an entry to the server, queued by priority.
+
+    Waiters of the same priority are served in arrival order.
+    """
+
+    _limit: int
+    _active: int
+    _queue: list[tuple[int, int, Future]]
+    _queued: dict[RequestPriority, int]
+    _requests: dict[RequestPriority, int]
+    _max_queued: int
+    _wait_time: Histogram
+    coalesced: int
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._active = 0
+        self._queue = []
+        self._sequence = count()
+
+        self._queued = {priority: 0 for priority in RequestPriority}
+        self._requests = {priority: 0 for priority in RequestPriority}
+        self._max_queued = 0
+        self._wait_time = Histogram(LATENCY_BUCKETS)
+
+        self.coalesced = 0
+
+    @property
+    def queued(self) -> int:
+        queued = sum(self._queued.values())
+
+        return queued
+
+    @property
+    def data(self) -> dict:
+        data = {
+            "limit": self._limit,
+            "active": self._active,
+            "queued": {
+                priority.name.lower(): queued
+                for priority, queued in self._queued.items()
+            },
+            "max_queued": self._max_queued,
+            "requests": {
+                priority.name.lower(): requests
+                for priority, requests in self._requests.items()
+            },
+            "coalesced": self.coalesced,
+            "wait_time": self._wait_time.to_dict(),
+        }
+
+        return data
+
+    @asynccontextmanager
+    async def acquire(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Hold one of the request slots, waits behind higher priorities."""
+        started = monotonic()
+
+        self._requests[priority] += 1
+
+        if self._active < self._limit and not self._queue:
+            self._active += 1
+
+        else:
+            await self._async_wait(priority)
+
+        self._wait_time.record((monotonic() - started) * 1000)
+
+        try:
+            yield
+
+        finally:
+            self._release()
+
+    async def _async_wait(self, priority: RequestPriority):
+        future = get_running_loop().create_future()
+
+        heappush(self._queue, (priority, next(self._sequence), future))
+
+        self._queued[priority] += 1
+        self._max_queued = max(self._max_queued, self.queued)
+
+        try:
+            await future
+
+        except CancelledError:
+            # The slot was handed over before the waiter went away
+            if future.done() and not future.cancelled():
+                self._release()
+
+            raise
+
+        finally:
+            self._queued[priority] -= 1
+
+    def _release(self):
+        """Hand the slot over to the next waiter, skipping cancelled ones."""
+        while self._queue:
+            _priority, _sequence, future = heappop(self._queue)
+
+            if not future.done():
+                future.set_result(None)
+
+                return
+
+        self._active -= 1
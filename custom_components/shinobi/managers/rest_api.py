@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from asyncio import sleep
+from asyncio import Semaphore, gather, sleep
 from datetime import datetime, timedelta
+from hashlib import blake2b
+from http import HTTPStatus
 import json
 import logging
 import sys
-from typing import Any
+from time import time
+from typing import Any, Awaitable, Callable
 
-from aiohttp import ClientResponse, ClientSession
+from aiohttp import ClientResponse, ClientSession, hdrs
+import orjson
 
 from homeassistant.const import ATTR_DATE
 from homeassistant.core import HomeAssistant
@@ -16,10 +20,14 @@ from homeassistant.helpers.dispatcher import dispatcher_send
 
 from ..common.connectivity_status import ConnectivityStatus
 from ..common.consts import (
+    ACCEPT_ENCODING,
     API_DATA_API_KEY,
+    API_DATA_BYTES_SAVED,
     API_DATA_DAYS,
     API_DATA_GROUP_ID,
+    API_DATA_LISTING_CACHE,
     API_DATA_SOCKET_IO_VERSION,
+    API_DATA_UNCHANGED_RESPONSES,
     API_DATA_USER_ID,
     ATTR_MONITOR_DETAILS,
     ATTR_MONITOR_DETAILS_DETECTOR,
@@ -28,31 +36,48 @@ from ..common.consts import (
     ATTR_MONITOR_ID,
     BASE_PROXY_URL,
     DEFAULT_NAME,
+    LISTING_TTL_PAST_DAY,
+    LISTING_TTL_TODAY,
     LOGIN_PASSWORD,
     LOGIN_USERNAME,
+    MONITOR_DETAILS_MAX_AGE,
     MONITOR_SIGNALS,
     SIGNAL_API_STATUS,
+    SIGNAL_MONITOR_REMOVED,
     SIGNAL_SERVER_DISCOVERED,
     URL_API_KEYS,
+    URL_API_PREFIX,
     URL_LOGIN,
+    URL_MONITOR,
     URL_MONITORS,
     URL_PARAMETER_API_KEY,
     URL_PARAMETER_BASE_URL,
     URL_PARAMETER_GROUP_ID,
     URL_PARAMETER_MONITOR_ID,
+    URL_SNAPSHOT,
     URL_SOCKET_IO_V4,
+    URL_TIME_LAPSE_FRAME,
     URL_UPDATE_MODE,
     URL_UPDATE_MONITOR,
     URL_VIDEO_WALL,
     URL_VIDEO_WALL_MONITOR,
-    URL_VIDEOS,
+    URL_VIDEO_WALL_MONITOR_DATE,
+    URL_VIDEOS_RANGE,
+    URL_VIDEOS_SINCE,
+    VIDEO_DETAILS_COUNT,
     VIDEO_DETAILS_EXTENSION,
+    VIDEO_DETAILS_SIZE,
     VIDEO_DETAILS_TIME,
+    VIDEO_DETAILS_TIME_INVALID_CHAR,
 )
 from ..common.enums import RequestType
 from ..models.config_data import ConfigData
+from ..models.endpoint_metrics import EndpointMetrics
 from ..models.exceptions import APIValidationException
+from ..models.listing_cache_item import ListingCacheItem
 from ..models.monitor_data import MonitorData
+from ..models.recording_day import RecordingDay
+from ..models.response_cache_item import ResponseCacheItem
 from .config_manager import ConfigManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -69,11 +94,23 @@ class RestAPI:
 
     _dispatched_devices: list
     _dispatched_server: bool
+    _monitor_fingerprints: dict[str, bytes]
+    _response_cache: dict[str, ResponseCacheItem]
+    _listings: dict[tuple[str | None, str | None], ListingCacheItem]
+    _listing_cache: dict[str, int]
+    _recording_days: dict[str, dict[str, RecordingDay]]
+    _recording_days_loaded_at: dict[str, float]
+    _monitors: dict[str, MonitorData]
+    _monitors_loaded_at: float
+    _bytes_saved: dict[str, int]
+    _endpoint_metrics: dict[str, EndpointMetrics]
+    _unchanged_responses: dict[str, int]
 
     def __init__(
         self,
         hass: HomeAssistant | None,
         config_manager: ConfigManager,
+        session: ClientSession | None = None,
     ):
         try:
             self._hass = hass
@@ -88,9 +125,24 @@ class RestAPI:
 
             self._status = None
 
-            self._session = None
+            self._session = session
             self._dispatched_devices = []
             self._dispatched_server = False
+            self._monitor_fingerprints = {}
+            self._response_cache = {}
+            self._listings = {}
+            self._recording_days = {}
+            self._recording_days_loaded_at = {}
+            self._listing_cache = {"hits": 0, "misses": 0, "invalidations": 0}
+            self._monitors = {}
+            self._monitors_loaded_at = 0
+            self._bytes_saved = {}
+            self._endpoint_metrics = {}
+            self._unchanged_responses = {}
+
+            self.data[API_DATA_BYTES_SAVED] = self._bytes_saved
+            self.data[API_DATA_UNCHANGED_RESPONSES] = self._unchanged_responses
+            self.data[API_DATA_LISTING_CACHE] = self._listing_cache
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -138,6 +190,12 @@ class RestAPI:
     def recorded_days(self):
         return self.data.get(API_DATA_DAYS, 10)
 
+    @property
+    def endpoint_metrics(self) -> dict[str, EndpointMetrics]:
+        endpoint_metrics = self._endpoint_metrics
+
+        return endpoint_metrics
+
     @property
     def support_video_browser_api(self):
         return self._support_video_browser_api
@@ -170,12 +228,16 @@ class RestAPI:
 
         return url
 
-    def build_url(self, endpoint: str, monitor_id: str = None):
-        url = self._build_url(self.config_data.api_url, endpoint, monitor_id)
+    def build_url(self, endpoint: str, monitor_id: str = None, **url_parameters):
+        url = self._build_url(
+            self.config_data.api_url, endpoint, monitor_id, **url_parameters
+        )
 
         return url
 
-    def _build_url(self, base_url: str, endpoint, monitor_id: str = None):
+    def _build_url(
+        self, base_url: str, endpoint, monitor_id: str = None, **url_parameters
+    ):
         if endpoint.startswith("/"):
             endpoint = endpoint[1:]
 
@@ -184,6 +246,7 @@ class RestAPI:
             URL_PARAMETER_GROUP_ID: self.group_id,
             URL_PARAMETER_API_KEY: self.api_key,
             URL_PARAMETER_MONITOR_ID: monitor_id,
+            **url_parameters,
         }
 
         url = endpoint.format(**data)
@@ -220,6 +283,8 @@ class RestAPI:
         is_url_encoded: bool = False,
     ):
         result = None
+        metrics = self._get_endpoint_metrics(endpoint)
+        started = metrics.start()
 
         try:
             self._validate_request(endpoint)
@@ -234,9 +299,13 @@ class RestAPI:
             async with self._session.post(
                 url, data=data, json=json_data, ssl=False
             ) as response:
+                metrics.set_response(response.status, response.content_length)
+
                 result = await self._handle_response(response)
 
         except Exception as ex:
+            metrics.errors += 1
+
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
 
@@ -244,6 +313,9 @@ class RestAPI:
                 f"Failed to post JSON to {endpoint}, Error: {ex}, Line: {line_number}"
             )
 
+        finally:
+            metrics.stop(started)
+
         await sleep(0.001)
 
         return result
@@ -288,7 +360,14 @@ class RestAPI:
         return result
 
     async def get_snapshot(self, url) -> bytes:
-        result = await self._async_get_url(url, RequestType.BYTES)
+        result = await self._async_get_url(url, URL_SNAPSHOT, RequestType.BYTES)
+
+        return result
+
+    async def get_timelapse_frame(self, monitor_id: str, date: str, file: str) -> bytes:
+        result = await self._async_get(
+            URL_TIME_LAPSE_FRAME, monitor_id, RequestType.BYTES, date=date, file=file
+        )
 
         return result
 
@@ -297,25 +376,32 @@ class RestAPI:
         endpoint: str,
         monitor_id: str = None,
         request_type: RequestType = RequestType.JSON,
+        **url_parameters,
     ):
         self._validate_request(endpoint)
 
-        url = self.build_url(endpoint, monitor_id)
+        url = self.build_url(endpoint, monitor_id, **url_parameters)
 
-        result = await self._async_get_url(url, request_type)
+        result = await self._async_get_url(url, endpoint, request_type)
 
         return result
 
     async def _async_get_url(
-        self, url: str, request_type: RequestType = RequestType.JSON
+        self, url: str, endpoint: str, request_type: RequestType = RequestType.JSON
     ):
         result = None
+        metrics = self._get_endpoint_metrics(endpoint)
+        started = metrics.start()
 
         try:
             async with self._session.get(url, ssl=False) as response:
+                metrics.set_response(response.status, response.content_length)
+
                 result = await self._handle_response(response, request_type)
 
         except Exception as ex:
+            metrics.errors += 1
+
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
 
@@ -323,10 +409,140 @@ class RestAPI:
                 f"Failed to get data from {url}, Error: {ex}, Line: {line_number}"
             )
 
+        finally:
+            metrics.stop(started)
+
         await sleep(0.001)
 
         return result
 
+    async def _async_get_if_changed(
+        self, endpoint: str, monitor_id: str = None
+    ) -> tuple[Any, bool]:
+        """GET JSON, returns the data and whether it changed since the last call.
+
+        Sends the validators of the last response (honoured by Shinobi behind
+        a caching proxy), otherwise compares a hash of the raw body before
+        decoding it.
+        """
+        self._validate_request(endpoint)
+
+        url = self.build_url(endpoint, monitor_id)
+        endpoint_name = self._get_endpoint_name(endpoint)
+        cache_item = self._response_cache.get(url)
+
+        headers = {hdrs.ACCEPT_ENCODING: ACCEPT_ENCODING}
+
+        if cache_item is not None:
+            if cache_item.etag is not None:
+                headers[hdrs.IF_NONE_MATCH] = cache_item.etag
+
+            if cache_item.last_modified is not None:
+                headers[hdrs.IF_MODIFIED_SINCE] = cache_item.last_modified
+
+        result = None
+        changed = True
+        metrics = self._get_endpoint_metrics(endpoint)
+        started = metrics.start()
+
+        try:
+            async with self._session.get(url, headers=headers, ssl=False) as response:
+                metrics.set_response(response.status, response.content_length)
+
+                if (
+                    response.status == HTTPStatus.NOT_MODIFIED
+                    and cache_item is not None
+                ):
+                    self._set_unchanged_response(endpoint_name, cache_item.size)
+
+                    result = cache_item.data
+                    changed = False
+
+                elif response.ok:
+                    body = await response.read()
+                    fingerprint = self._get_fingerprint(body)
+
+                    if (
+                        response.content_length is not None
+                        and hdrs.CONTENT_ENCODING in response.headers
+                    ):
+                        self._add_bytes_saved(
+                            endpoint_name, len(body) - response.content_length
+                        )
+
+                    if cache_item is not None and cache_item.fingerprint == fingerprint:
+                        self._set_unchanged_response(endpoint_name, 0)
+
+                        result = cache_item.data
+                        changed = False
+
+                    else:
+                        result = await self._handle_response(response)
+
+                        if result is not None:
+                            self._response_cache[url] = ResponseCacheItem(
+                                response.headers.get(hdrs.ETAG),
+                                response.headers.get(hdrs.LAST_MODIFIED),
+                                fingerprint,
+                                len(body),
+                                result,
+                            )
+
+                else:
+                    result = await self._handle_response(response)
+
+        except Exception as ex:
+            metrics.errors += 1
+
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to get data from {url}, Error: {ex}, Line: {line_number}"
+            )
+
+        finally:
+            metrics.stop(started)
+
+        await sleep(0.001)
+
+        return result, changed
+
+    def _set_unchanged_response(self, endpoint_name: str, bytes_saved: int):
+        _LOGGER.debug(f"Response of {endpoint_name} was not changed")
+
+        self._unchanged_responses[endpoint_name] = (
+            self._unchanged_responses.get(endpoint_name, 0) + 1
+        )
+
+        self._add_bytes_saved(endpoint_name, bytes_saved)
+
+    def _add_bytes_saved(self, endpoint_name: str, bytes_saved: int):
+        if bytes_saved > 0:
+            self._bytes_saved[endpoint_name] = (
+                self._bytes_saved.get(endpoint_name, 0) + bytes_saved
+            )
+
+    def _get_endpoint_metrics(self, endpoint: str) -> EndpointMetrics:
+        endpoint_name = self._get_endpoint_name(endpoint)
+        metrics = self._endpoint_metrics.get(endpoint_name)
+
+        if metrics is None:
+            metrics = EndpointMetrics()
+
+            self._endpoint_metrics[endpoint_name] = metrics
+
+        return metrics
+
+    @staticmethod
+    def _get_endpoint_name(endpoint: str) -> str:
+        """Endpoint template without the base URL and API key, e.g. /monitor/{group_id}."""
+        endpoint_name = endpoint.replace(URL_API_PREFIX, "").replace(
+            f"{{{URL_PARAMETER_BASE_URL}}}", "/"
+        )
+
+        return endpoint_name
+
     async def update(self):
         _LOGGER.debug(
             f"Updating data from Shinobi Video Server ({self.config_data.hostname})"
@@ -467,11 +683,16 @@ class RestAPI:
     async def _load_monitors(self):
         _LOGGER.debug("Retrieving monitors")
 
-        response: dict = await self._async_get(URL_MONITORS)
+        response, changed = await self._async_get_if_changed(URL_MONITORS)
 
         if response is None:
             _LOGGER.warning("No monitors were found")
 
+        elif not changed:
+            _LOGGER.debug("Monitors were not changed")
+
+            self._monitors_loaded_at = time()
+
         else:
             if isinstance(response, list):
                 monitors = response
@@ -479,30 +700,38 @@ class RestAPI:
             else:
                 monitors: list = [response]
 
+            monitor_ids = []
+
             for monitor in monitors:
                 try:
                     if monitor is None:
                         _LOGGER.warning("Invalid monitor details found")
 
                     else:
+                        monitor_id = monitor.get(ATTR_MONITOR_ID)
+                        monitor_ids.append(monitor_id)
+
+                        fingerprint = self._get_monitor_fingerprint(monitor)
+
+                        if self._monitor_fingerprints.get(monitor_id) == fingerprint:
+                            continue
+
                         monitor_details = monitor.get(ATTR_MONITOR_DETAILS)
 
                         if monitor_details is None:
                             _LOGGER.warning(f"Invalid monitor data, Data: {monitor}")
                             continue
 
-                        if isinstance(monitor_details, dict):
-                            monitor[ATTR_MONITOR_DETAILS] = monitor_details
-
-                        else:
-                            details = json.loads(monitor_details)
-
-                            monitor[ATTR_MONITOR_DETAILS] = details
+                        monitor[ATTR_MONITOR_DETAILS] = self._get_monitor_details(
+                            monitor
+                        )
 
                         monitor_data = MonitorData(monitor)
 
                         self._set_monitor_data(monitor_data)
 
+                        self._monitor_fingerprints[monitor_id] = fingerprint
+
                 except Exception as ex:
                     exc_type, exc_obj, tb = sys.exc_info()
                     line_number = tb.tb_lineno
@@ -511,7 +740,14 @@ class RestAPI:
                         f"Failed to load monitor data: {monitor}, Error: {ex}, Line: {line_number}"
                     )
 
+            self._remove_monitors(monitor_ids)
+
+            self._monitors_loaded_at = time()
+
     async def _initialize_session(self):
+        if self._session is not None and not self._session.closed:
+            return
+
         try:
             if self._is_home_assistant:
                 self._session = async_create_clientsession(hass=self._hass)
@@ -536,49 +772,235 @@ class RestAPI:
         if new_device:
             self._dispatched_devices.append(monitor.id)
 
+        self._monitors[monitor.id] = monitor
+
         self._async_dispatcher_send(
             monitor_signal,
             monitor,
         )
 
+    def _remove_monitors(self, monitor_ids: list[str]):
+        removed_monitor_ids = [
+            monitor_id
+            for monitor_id in self._dispatched_devices
+            if monitor_id not in monitor_ids
+        ]
+
+        for monitor_id in removed_monitor_ids:
+            _LOGGER.info(f"Monitor {monitor_id} was removed from the server")
+
+            self._dispatched_devices.remove(monitor_id)
+            self._monitors.pop(monitor_id, None)
+            self._monitor_fingerprints.pop(monitor_id, None)
+            self._recording_days.pop(monitor_id, None)
+            self._recording_days_loaded_at.pop(monitor_id, None)
+
+            self._async_dispatcher_send(SIGNAL_MONITOR_REMOVED, monitor_id)
+
+    def invalidate_listings(self, monitor_id: str):
+        """Drop listings a new recording of the monitor may be part of."""
+        yesterday = (datetime.today() - timedelta(days=1)).date().isoformat()
+
+        keys = [
+            key
+            for key, item in self._listings.items()
+            if item.monitor_id in (monitor_id, None)
+            and (item.date is None or item.date >= yesterday)
+        ]
+
+        for key in keys:
+            self._listings.pop(key)
+
+        self._listing_cache["invalidations"] += len(keys)
+
+        self._recording_days_loaded_at.pop(monitor_id, None)
+
+    async def _async_get_recording_days(
+        self, monitor_id: str
+    ) -> dict[str, RecordingDay] | None:
+        """Days with recordings of the monitor within the retention, None when
+        the recordings could not be listed.
+
+        The first load lists the whole retention in one query, later loads list
+        from the latest known day on, earlier days are complete.
+        """
+        recording_days = self._recording_days.get(monitor_id)
+        loaded_at = self._recording_days_loaded_at.get(monitor_id)
+
+        if (
+            loaded_at is not None
+            and time() - loaded_at < LISTING_TTL_TODAY.total_seconds()
+        ):
+            return recording_days
+
+        today = datetime.today()
+        first_date = (today - timedelta(days=self.recorded_days - 1)).date()
+        first_day = first_date.isoformat()
+
+        start_day = first_day
+
+        if recording_days:
+            start_day = max(max(recording_days.keys()), first_day)
+
+        # A day earlier, the server may read the start in another time zone
+        query_date = datetime.fromisoformat(start_day) - timedelta(days=1)
+        query_day = query_date.date().isoformat()
+
+        response: dict | None = await self._async_get(
+            URL_VIDEOS_SINCE, monitor_id, start=f"{query_day}T00:00:00"
+        )
+
+        if response is None:
+            return recording_days
+
+        days = {
+            date: recording_day
+            for date, recording_day in (recording_days or {}).items()
+            if first_day <= date < start_day
+        }
+
+        for video_data in response.get("data", []):
+            video_time = video_data.get(VIDEO_DETAILS_TIME)
+
+            if not video_time:
+                continue
+
+            date = self._get_local_date(video_time)
+
+            # Earlier days are complete, outside the retention or already counted
+            if date < start_day:
+                continue
+
+            recording_day = days.get(date)
+
+            if recording_day is None:
+                recording_day = RecordingDay(date)
+
+                days[date] = recording_day
+
+            recording_day.add(video_data.get(VIDEO_DETAILS_SIZE) or 0)
+
+        self._recording_days[monitor_id] = days
+        self._recording_days_loaded_at[monitor_id] = time()
+
+        _LOGGER.debug(
+            f"Recording days of monitor {monitor_id} loaded from {start_day}, "
+            f"Days: {len(days)}"
+        )
+
+        return days
+
+    @staticmethod
+    def _get_local_date(video_time: str) -> str:
+        """Local date of a recording, days are queried by local time bounds.
+
+        Times of the server are UTC, marked by a trailing Z.
+        """
+        if video_time.lower().endswith(VIDEO_DETAILS_TIME_INVALID_CHAR):
+            video_time = f"{video_time[:-1]}+00:00"
+
+        try:
+            date = datetime.fromisoformat(video_time).astimezone().date().isoformat()
+
+        except ValueError:
+            date = video_time[:10]
+
+        return date
+
+    def _get_listing(self, monitor_id: str | None, date: str | None) -> list | None:
+        item = self._listings.get((monitor_id, date))
+
+        if item is None or item.is_expired:
+            self._listing_cache["misses"] += 1
+
+            return None
+
+        self._listing_cache["hits"] += 1
+
+        return item.data
+
+    def _set_listing(self, monitor_id: str | None, date: str | None, data: list):
+        """Past days change only by retention, today and the day lists change
+        with every recording.
+        """
+        today = datetime.today().date().isoformat()
+
+        is_past_day = date is not None and date < today
+        ttl = LISTING_TTL_PAST_DAY if is_past_day else LISTING_TTL_TODAY
+
+        self._listings[(monitor_id, date)] = ListingCacheItem(
+            monitor_id, date, data, ttl.total_seconds()
+        )
+
+        expired_keys = [key for key, item in self._listings.items() if item.is_expired]
+
+        for key in expired_keys:
+            self._listings.pop(key)
+
     async def get_video_wall(self) -> list[dict] | None:
         result = None
 
         if self._support_video_browser_api:
-            response: dict | None = await self._async_get(URL_VIDEO_WALL)
+            result = self._get_listing(None, None)
+
+            if result is not None:
+                return result
+
+            response, _changed = await self._async_get_if_changed(URL_VIDEO_WALL)
 
             if response is not None:
                 result = response.get("data", [])
 
+                self._set_listing(None, None, result)
+
         return result
 
     async def get_video_wall_monitor(self, monitor_id: str) -> list[dict] | None:
         result = []
 
         if self._support_video_browser_api:
-            response: dict | None = await self._async_get(
+            listing = self._get_listing(monitor_id, None)
+
+            if listing is not None:
+                return listing
+
+            response, _changed = await self._async_get_if_changed(
                 URL_VIDEO_WALL_MONITOR, monitor_id
             )
 
             if response is not None:
                 result = response.get("data", [])
 
+                self._set_listing(monitor_id, None, result)
+
         else:
-            today = datetime.today()
+            recording_days = await self._async_get_recording_days(monitor_id)
 
-            for day_offset in range(0, self.recorded_days):
-                lookup_date = today - timedelta(days=day_offset)
+            if recording_days is None:
+                # Recordings could not be listed, offer every day of the retention
+                today = datetime.today()
 
-                video_date_time_iso = lookup_date.isoformat()
-                video_date_time_iso_parts = video_date_time_iso.split("T")
-                video_date_iso = video_date_time_iso_parts[0]
+                dates = [
+                    (today - timedelta(days=day_offset)).date().isoformat()
+                    for day_offset in range(0, self.recorded_days)
+                ]
+
+            else:
+                dates = sorted(recording_days.keys(), reverse=True)
 
+            for video_date_iso in dates:
                 monitor_data = {
                     ATTR_MONITOR_ID: monitor_id,
                     ATTR_MONITOR_GROUP_ID: self.group_id,
                     ATTR_DATE: video_date_iso,
                 }
 
+                if recording_days is not None:
+                    recording_day = recording_days[video_date_iso]
+
+                    monitor_data[VIDEO_DETAILS_COUNT] = recording_day.count
+                    monitor_data[VIDEO_DETAILS_SIZE] = recording_day.size
+
                 result.append(monitor_data)
 
         return result
@@ -586,21 +1008,32 @@ class RestAPI:
     async def get_video_wall_monitor_date(
         self, monitor_id: str, date: str
     ) -> list[dict] | None:
+        result = self._get_listing(monitor_id, date)
+
+        if result is not None:
+            return result
+
         result = []
 
         if self._support_video_browser_api:
-            url = self.build_url(URL_VIDEO_WALL_MONITOR, monitor_id)
-            endpoint = f"{url}/{date}"
-
-            response: dict | None = await self._async_get(endpoint)
+            response: dict | None = await self._async_get(
+                URL_VIDEO_WALL_MONITOR_DATE, monitor_id, date=date
+            )
 
             if response is not None:
                 result = response.get("data", [])
 
+                self._set_listing(monitor_id, date, result)
+
         else:
-            url = self.build_url(URL_VIDEOS, monitor_id)
-            endpoint = f"{url}?start={date}T00:00:00&end={date}T23:59:59&noLimit=1"
-            response: dict | None = await self._async_get(endpoint)
+            recording_days = await self._async_get_recording_days(monitor_id)
+
+            if recording_days is not None and date not in recording_days:
+                return result
+
+            response: dict | None = await self._async_get(
+                URL_VIDEOS_RANGE, monitor_id, date=date
+            )
 
             if response is not None:
                 videos = response.get("data", [])
@@ -617,83 +1050,206 @@ class RestAPI:
 
                     result.append(monitor_data)
 
+                self._set_listing(monitor_id, date, result)
+
         return result
 
-    async def set_monitor_mode(self, monitor_id: str, mode: str):
+    async def set_monitors_mode(
+        self, monitor_ids: list[str], mode: str
+    ) -> dict[str, bool]:
+        """Set the mode of many monitors concurrently, returns the result per monitor."""
+        monitor_results = await self._async_run_per_monitor(
+            monitor_ids, lambda monitor_id: self.set_monitor_mode(monitor_id, mode)
+        )
+
+        return monitor_results
+
+    async def set_monitor_mode(self, monitor_id: str, mode: str) -> bool:
         _LOGGER.info(f"Updating monitor {monitor_id} mode to {mode}")
 
-        endpoint = f"{URL_UPDATE_MODE}/{mode}"
+        result = False
 
-        response = await self._async_get(endpoint, monitor_id)
+        try:
+            response = await self._async_get(URL_UPDATE_MODE, monitor_id, mode=mode)
 
-        response_message = {} if response is None else response.get("msg")
+            response_message = None if response is None else response.get("msg")
 
-        result = response.get("ok", False)
+            result = response is not None and response.get("ok", False)
 
-        if result:
-            _LOGGER.info(f"{response_message} for {monitor_id}")
-        else:
-            _LOGGER.warning(f"{response_message} for {monitor_id}")
+            if result:
+                _LOGGER.info(f"{response_message} for {monitor_id}")
+            else:
+                _LOGGER.warning(f"{response_message} for {monitor_id}")
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to update monitor {monitor_id} mode, Error: {ex}, Line: {line_number}"
+            )
 
         return result
 
-    async def set_motion_detection(self, monitor_id: str, enabled: bool):
-        await self._async_set_detection_mode(
-            monitor_id, ATTR_MONITOR_DETAILS_DETECTOR, enabled
+    async def set_motion_detection(self, monitor_id: str, enabled: bool) -> bool:
+        results = await self.set_detection(
+            [monitor_id], ATTR_MONITOR_DETAILS_DETECTOR, enabled
         )
 
-    async def set_sound_detection(self, monitor_id: str, enabled: bool):
-        await self._async_set_detection_mode(
-            monitor_id, ATTR_MONITOR_DETAILS_DETECTOR_AUDIO, enabled
+        return results[monitor_id]
+
+    async def set_sound_detection(self, monitor_id: str, enabled: bool) -> bool:
+        results = await self.set_detection(
+            [monitor_id], ATTR_MONITOR_DETAILS_DETECTOR_AUDIO, enabled
         )
 
+        return results[monitor_id]
+
+    async def set_detection(
+        self, monitor_ids: list[str], detector: str, enabled: bool
+    ) -> dict[str, bool]:
+        """Set a detector of many monitors concurrently, returns the result per monitor."""
+        monitor_results = await self._async_run_per_monitor(
+            monitor_ids,
+            lambda monitor_id: self._async_set_detection_mode(
+                monitor_id, detector, enabled
+            ),
+        )
+
+        return monitor_results
+
+    async def _async_run_per_monitor(
+        self, monitor_ids: list[str], handler: Callable[[str], Awaitable[bool]]
+    ) -> dict[str, bool]:
+        semaphore = Semaphore(self._config_manager.max_concurrent_requests)
+
+        async def run(monitor_id: str) -> bool:
+            async with semaphore:
+                result = await handler(monitor_id)
+
+            return result
+
+        results = await gather(*[run(monitor_id) for monitor_id in monitor_ids])
+
+        monitor_results = dict(zip(monitor_ids, results))
+
+        return monitor_results
+
     async def _async_set_detection_mode(
         self, monitor_id: str, detector: str, enabled: bool
-    ):
+    ) -> bool:
         _LOGGER.info(f"Updating monitor {monitor_id} {detector} to {enabled}")
 
-        url = f"{URL_MONITORS}/{monitor_id}"
+        result = False
 
-        response: dict = await self._async_get(url)
-        monitor_data = response[0]
-        monitor_details_str = monitor_data.get(ATTR_MONITOR_DETAILS)
-        details = json.loads(monitor_details_str)
+        try:
+            monitor_data = await self._async_get_monitor_data(monitor_id)
 
-        details[detector] = str(1 if enabled else 0)
+            if monitor_data is None:
+                _LOGGER.warning(f"Monitor {monitor_id} was not found")
 
-        monitor_data[ATTR_MONITOR_DETAILS] = details
+            else:
+                details = dict(monitor_data[ATTR_MONITOR_DETAILS])
+                details[detector] = str(1 if enabled else 0)
 
-        data = {"data": monitor_data}
+                monitor_data = dict(monitor_data)
+                monitor_data[ATTR_MONITOR_DETAILS] = details
 
-        response = await self._async_post(URL_UPDATE_MONITOR, data, monitor_id, True)
+                data = {"data": monitor_data}
 
-        response_message = response.get("msg")
+                response = await self._async_post(
+                    URL_UPDATE_MONITOR, data, monitor_id, True
+                )
 
-        result = response.get("ok", False)
+                response_message = None if response is None else response.get("msg")
 
-        if result:
-            _LOGGER.info(f"{response_message} for {monitor_id}")
-        else:
-            _LOGGER.warning(f"{response_message} for {monitor_id}")
+                result = response is not None and response.get("ok", False)
+
+                if result:
+                    _LOGGER.info(f"{response_message} for {monitor_id}")
+
+                    self._set_monitor_data(MonitorData(monitor_data))
+
+                else:
+                    _LOGGER.warning(f"{response_message} for {monitor_id}")
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
 
-    async def _async_update_monitor_details(self, monitor_id: str):
+            _LOGGER.error(
+                f"Failed to update monitor {monitor_id} {detector}, Error: {ex}, Line: {line_number}"
+            )
+
+        return result
+
+    async def _async_get_monitor_data(self, monitor_id: str) -> dict | None:
+        """Monitor data from the last monitors update when fresh, otherwise from the API."""
+        monitor = self._monitors.get(monitor_id)
+        monitors_age = time() - self._monitors_loaded_at
+
+        if (
+            monitor is not None
+            and monitors_age < MONITOR_DETAILS_MAX_AGE.total_seconds()
+        ):
+            return monitor.details
+
+        response: list | None = await self._async_get(URL_MONITOR, monitor_id)
+
+        if not response:
+            return None
+
+        monitor_data = response[0]
+        monitor_data[ATTR_MONITOR_DETAILS] = self._get_monitor_details(monitor_data)
+
+        return monitor_data
+
+    async def update_monitor_details(self, monitor_id: str):
         _LOGGER.debug(f"Updating monitor details for {monitor_id}")
 
         if self.status == ConnectivityStatus.Connected:
-            url = f"{URL_MONITORS}/{monitor_id}"
+            response: list | None = await self._async_get(URL_MONITOR, monitor_id)
 
-            response: dict = await self._async_get(url)
-            monitor_data = response[0]
+            if not response:
+                _LOGGER.warning(f"Monitor {monitor_id} was not found")
+                return
 
-            monitor_details_str = monitor_data.get(ATTR_MONITOR_DETAILS)
-            details = json.loads(monitor_details_str)
+            monitor_data = response[0]
+            fingerprint = self._get_monitor_fingerprint(monitor_data)
 
-            monitor_data[ATTR_MONITOR_DETAILS] = details
+            monitor_data[ATTR_MONITOR_DETAILS] = self._get_monitor_details(monitor_data)
 
             monitor_data = MonitorData(monitor_data)
 
-            if monitor_data is not None:
-                self._set_monitor_data(monitor_data)
+            self._set_monitor_data(monitor_data)
+
+            self._monitor_fingerprints[monitor_id] = fingerprint
+
+    @staticmethod
+    def _get_monitor_fingerprint(monitor: dict) -> bytes:
+        """Hash of the raw monitor payload, used to skip unchanged monitors."""
+        payload = orjson.dumps(monitor, option=orjson.OPT_SORT_KEYS)
+
+        fingerprint = RestAPI._get_fingerprint(payload)
+
+        return fingerprint
+
+    @staticmethod
+    def _get_fingerprint(data: bytes) -> bytes:
+        fingerprint = blake2b(data, digest_size=16).digest()
+
+        return fingerprint
+
+    @staticmethod
+    def _get_monitor_details(monitor: dict) -> dict:
+        monitor_details = monitor.get(ATTR_MONITOR_DETAILS)
+
+        if isinstance(monitor_details, dict):
+            return monitor_details
+
+        details = json.loads(monitor_details)
+
+        return details
 
     def _set_status(self, status: ConnectivityStatus):
         if status != self._status:
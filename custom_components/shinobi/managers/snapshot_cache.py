@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from asyncio import Future, Task, shield, sleep
+from collections import OrderedDict
+import logging
+
+from homeassistant.core import HomeAssistant
+
+from ..common.enums import RequestPriority
+from ..common.image_resizer import get_variant_size, resize_jpeg
+from ..models.snapshot_cache_item import SnapshotCacheItem
+from .config_manager import ConfigManager
+from .request_limiter import RequestLimiter
+from .rest_api import RestAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SnapshotCache:
+    """Snapshot per monitor, fresh for the configured TTL, evicted LRU by size.
+
+    Concurrent requests for a monitor share a single upstream fetch, downscaled
+    variants are resized once per snapshot and cached next to it.
+    """
+
+    _hass: HomeAssistant
+    _config_manager: ConfigManager
+    _api: RestAPI
+    _request_limiter: RequestLimiter
+    _items: OrderedDict[str, SnapshotCacheItem]
+    _pending: dict[str, Task]
+    _prefetches: dict[str, Task]
+    _resizes: dict[tuple[SnapshotCacheItem, int], Future]
+    _size: int
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_manager: ConfigManager,
+        api: RestAPI,
+        request_limiter: RequestLimiter,
+    ):
+        self._hass = hass
+        self._config_manager = config_manager
+        self._api = api
+        self._request_limiter = request_limiter
+
+        self._items = OrderedDict()
+        self._pending = {}
+        self._prefetches = {}
+        self._resizes = {}
+        self._size = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+        self._prefetched = 0
+        self._resized = 0
+
+    @property
+    def data(self) -> dict:
+        data = {
+            "items": len(self._items),
+            "size": self._size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "evictions": self._evictions,
+            "prefetched": self._prefetched,
+            "resized": self._resized,
+        }
+
+        return data
+
+    async def get(
+        self,
+        monitor_id: str,
+        url: str,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> bytes | None:
+        """Snapshot of the monitor, downscaled to fit width / height when set."""
+        item = await self.get_item(monitor_id, url)
+
+        if item is None:
+            return None
+
+        data = item.data
+        variant_size = get_variant_size(width, height)
+
+        # Variants are kept only for the cached snapshot, an evicted one is sent as-is
+        if variant_size is not None and self._items.get(monitor_id) is item:
+            data = await self._async_get_variant(item, variant_size)
+
+        return data
+
+    async def get_item(
+        self, monitor_id: str, url: str, max_age: float | None = None
+    ) -> SnapshotCacheItem | None:
+        """Cached snapshot up to max_age seconds old (snapshot TTL by default).
+
+        Falls back to the previous snapshot when fetching a new one fails.
+        """
+        if max_age is None:
+            max_age = self._config_manager.snapshot_ttl
+
+        item = self._items.get(monitor_id)
+
+        if item is not None and item.age < max_age:
+            self._hits += 1
+            self._items.move_to_end(monitor_id)
+
+            return item
+
+        if monitor_id in self._pending:
+            self._coalesced += 1
+
+        else:
+            self._misses += 1
+
+        task = self._get_fetch_task(monitor_id, url)
+
+        # Shielded, a viewer that goes away does not cancel the fetch of the others
+        fetched_item = await shield(task)
+
+        if fetched_item is not None:
+            item = fetched_item
+
+        return item
+
+    async def _async_get_variant(self, item: SnapshotCacheItem, size: int) -> bytes:
+        variant = item.variants.get(size)
+
+        if variant is not None:
+            return variant
+
+        key = (item, size)
+        future = self._resizes.get(key)
+
+        if future is None:
+            future = self._hass.async_add_executor_job(resize_jpeg, item.data, size)
+
+            self._resizes[key] = future
+
+        try:
+            variant = await shield(future)
+
+        except Exception as ex:
+            _LOGGER.warning(
+                f"Failed to resize snapshot of monitor {item.monitor_id} to {size}, "
+                f"Error: {ex}"
+            )
+
+            return item.data
+
+        finally:
+            if self._resizes.get(key) is future:
+                self._resizes.pop(key)
+
+        is_cached = self._items.get(item.monitor_id) is item
+
+        if is_cached and size not in item.variants:
+            item.variants[size] = variant
+
+            self._resized += 1
+            self._size += len(variant)
+
+            self._evict()
+
+        return variant
+
+    def prefetch(self, monitor_id: str, url: str):
+        """Fetch a burst of snapshots in the background, unless one is running."""
+        frames = self._config_manager.snapshot_prefetch_frames
+
+        if frames > 0 and monitor_id not in self._prefetches:
+            task = self._hass.async_create_task(
+                self._async_prefetch(monitor_id, url, frames)
+            )
+
+            self._prefetches[monitor_id] = task
+
+    def remove(self, monitor_id: str):
+        item = self._items.pop(monitor_id, None)
+
+        if item is not None:
+            self._size -= item.size
+
+    def clear(self):
+        for tasks in [self._prefetches, self._pending]:
+            for task in list(tasks.values()):
+                task.cancel()
+
+            tasks.clear()
+
+        self._resizes.clear()
+        self._items.clear()
+        self._size = 0
+
+    async def _async_prefetch(self, monitor_id: str, url: str, frames: int):
+        try:
+            interval = self._config_manager.snapshot_prefetch_interval
+
+            for frame in range(frames):
+                if frame > 0:
+                    await sleep(interval)
+
+                item = await shield(self._get_fetch_task(monitor_id, url))
+
+                if item is not None:
+                    self._prefetched += 1
+
+        finally:
+            self._prefetches.pop(monitor_id, None)
+
+    def _get_fetch_task(self, monitor_id: str, url: str) -> Task:
+        task = self._pending.get(monitor_id)
+
+        if task is None:
+            task = self._hass.async_create_task(self._async_fetch(monitor_id, url))
+
+            self._pending[monitor_id] = task
+
+        return task
+
+    async def _async_fetch(self, monitor_id: str, url: str) -> SnapshotCacheItem | None:
+        try:
+            async with self._request_limiter.acquire(RequestPriority.SNAPSHOT):
+                data = await self._api.get_snapshot(url)
+
+            item = self._set(monitor_id, data) if data else None
+
+            return item
+
+        finally:
+            self._pending.pop(monitor_id, None)
+
+    def _set(self, monitor_id: str, data: bytes) -> SnapshotCacheItem:
+        self.remove(monitor_id)
+
+        item = SnapshotCacheItem(monitor_id, data)
+
+        self._items[monitor_id] = item
+        self._size += item.size
+
+        self._evict()
+
+        return item
+
+    def _evict(self):
+        max_size = self._config_manager.snapshot_cache_size
+
+        while self._size > max_size and len(self._items) > 1:
+            evicted_monitor_id, evicted_item = self._items.popitem(last=False)
+
+            self._size -= evicted_item.size
+            self._evictions += 1
+
+            _LOGGER.debug(f"Snapshot of monitor {evicted_monitor_id} evicted")
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from asyncio import Task, shield
+from collections import OrderedDict
+from hashlib import blake2b
+import logging
+import os
+import shutil
+import sys
+
+from homeassistant.core import HomeAssistant
+
+from ..common.consts import DOMAIN
+from ..common.enums import RequestPriority
+from .config_manager import ConfigManager
+from .request_limiter import RequestLimiter
+from .rest_api import RestAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TimelapseCache:
+    """Timelapse frames on disk, evicted LRU by size.
+
+    Frames never change once written by the server, cached files are kept
+    across restarts, recency is restored from their modification time.
+    """
+
+    _hass: HomeAssistant
+    _config_manager: ConfigManager
+    _api: RestAPI
+    _request_limiter: RequestLimiter
+    _directory: str
+    _items: OrderedDict[str, int]
+    _pending: dict[str, Task]
+    _size: int
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_manager: ConfigManager,
+        api: RestAPI,
+        request_limiter: RequestLimiter,
+    ):
+        self._hass = hass
+        self._config_manager = config_manager
+        self._api = api
+        self._request_limiter = request_limiter
+
+        self._directory = self.get_directory(hass, config_manager.entry_id)
+
+        self._items = OrderedDict()
+        self._pending = {}
+        self._size = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    @property
+    def data(self) -> dict:
+        data = {
+            "items": len(self._items),
+            "size": self._size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "evictions": self._evictions,
+        }
+
+        return data
+
+    @staticmethod
+    def get_directory(hass: HomeAssistant, entry_id: str) -> str:
+        directory = hass.config.path(".cache", DOMAIN, "timelapse", entry_id)
+
+        return directory
+
+    @staticmethod
+    async def async_remove(hass: HomeAssistant, entry_id: str):
+        """Delete the cached frames of a removed entry."""
+        directory = TimelapseCache.get_directory(hass, entry_id)
+
+        # ignore_errors, the directory is missing when nothing was cached
+        await hass.async_add_executor_job(shutil.rmtree, directory, True)
+
+        _LOGGER.debug(f"Timelapse cache removed, Entry ID: {entry_id}")
+
+    async def initialize(self):
+        items = await self._hass.async_add_executor_job(self._load)
+
+        for file_name, size in items:
+            self._items[file_name] = size
+            self._size += size
+
+        await self._async_evict()
+
+        _LOGGER.debug(
+            f"Timelapse cache loaded, Files: {len(self._items)}, Size: {self._size}"
+        )
+
+    async def get(self, monitor_id: str, date: str, file: str) -> bytes | None:
+        """Cached frame, fetched from the server on a miss.
+
+        Read here rather than served from its path, a concurrent write may evict
+        the file before a response opens it.
+        """
+        file_name = self._get_file_name(monitor_id, date, file)
+
+        if file_name in self._items:
+            self._hits += 1
+            self._items.move_to_end(file_name)
+
+            try:
+                data = await self._hass.async_add_executor_job(
+                    self._read, self._get_path(file_name)
+                )
+
+            except FileNotFoundError:
+                # Removed outside of the cache, fetched again on the next request
+                if file_name in self._items:
+                    self._size -= self._items.pop(file_name)
+
+                _LOGGER.debug(
+                    f"Timelapse frame {date}/{file} of monitor {monitor_id} "
+                    "was removed while it was read"
+                )
+
+                return None
+
+            return data
+
+        task = self._pending.get(file_name)
+
+        if task is None:
+            self._misses += 1
+
+            task = self._hass.async_create_task(
+                self._async_fetch(file_name, monitor_id, date, file)
+            )
+
+            self._pending[file_name] = task
+
+        else:
+            self._coalesced += 1
+
+        # Shielded, a viewer that goes away does not cancel the fetch of the others
+        data = await shield(task)
+
+        return data
+
+    def clear(self):
+        """Cancel pending fetches, cached files are kept for the next run."""
+        for task in list(self._pending.values()):
+            task.cancel()
+
+        self._pending.clear()
+        self._items.clear()
+        self._size = 0
+
+    async def _async_fetch(
+        self, file_name: str, monitor_id: str, date: str, file: str
+    ) -> bytes | None:
+        try:
+            async with self._request_limiter.acquire(RequestPriority.THUMBNAIL):
+                data = await self._api.get_timelapse_frame(monitor_id, date, file)
+
+            if not data:
+                return None
+
+            path = self._get_path(file_name)
+
+            await self._hass.async_add_executor_job(self._write, path, data)
+
+            self._items[file_name] = len(data)
+            self._size += len(data)
+
+            await self._async_evict()
+
+            return data
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.warning(
+                f"Failed to cache timelapse frame {date}/{file} of monitor {monitor_id}, "
+                f"Error: {ex}, Line: {line_number}"
+            )
+
+            return None
+
+        finally:
+            self._pending.pop(file_name, None)
+
+    async def _async_evict(self):
+        max_size = self._config_manager.timelapse_cache_size
+        paths = []
+
+        while self._size > max_size and len(self._items) > 1:
+            file_name, size = self._items.popitem(last=False)
+
+            self._size -= size
+            self._evictions += 1
+
+            paths.append(self._get_path(file_name))
+
+        if paths:
+            await self._hass.async_add_executor_job(self._remove, paths)
+
+            _LOGGER.debug(f"{len(paths)} timelapse frames evicted")
+
+    @staticmethod
+    def _get_file_name(monitor_id: str, date: str, file: str) -> str:
+        """Hashed, request parameters never become part of a path."""
+        key = f"{monitor_id}/{date}/{file}"
+
+        file_name = blake2b(key.encode(), digest_size=16).hexdigest()
+
+        return file_name
+
+    def _get_path(self, file_name: str) -> str:
+        path = os.path.join(self._directory, file_name)
+
+        return path
+
+    def _load(self) -> list[tuple[str, int]]:
+        """Cached files, least recently written first, blocking."""
+        if not os.path.isdir(self._directory):
+            return []
+
+        entries = [
+            entry
+            for entry in os.scandir(self._directory)
+            if entry.is_file() and not entry.name.endswith(".tmp")
+        ]
+
+        stats = [(entry.name, entry.stat()) for entry in entries]
+        stats.sort(key=lambda item: item[1].st_mtime)
+
+        items = [(file_name, stat.st_size) for file_name, stat in stats]
+
+        return items
+
+    @staticmethod
+    def _read(path: str) -> bytes:
+        with open(path, "rb") as file:
+            data = file.read()
+
+        return data
+
+    def _write(self, path: str, data: bytes):
+        """Write through a temporary file, a partial frame is never served."""
+        os.makedirs(self._directory, exist_ok=True)
+
+        temporary_path = f"{path}.tmp"
+
+        with open(temporary_path, "wb") as file:
+            file.write(data)
+
+        os.replace(temporary_path, path)
+
+    @staticmethod
+    def _remove(paths: list[str]):
+        for path in paths:
+            try:
+                os.remove(path)
+
+            except FileNotFoundError:
+                pass
@@ -6,6 +6,7 @@ from datetime import datetime
 import json
 import logging
 import sys
+from time import perf_counter, time
 from typing import Any, Callable
 
 import aiohttp
@@ -14,21 +15,20 @@ from aiohttp import ClientSession
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.helpers.dispatcher import dispatcher_send
-from homeassistant.helpers.event import async_track_time_interval
 
 from ..common.connectivity_status import ConnectivityStatus
 from ..common.consts import (
     API_DATA_API_KEY,
+    API_DATA_DROPPED_EVENTS,
     API_DATA_GROUP_ID,
+    API_DATA_JSON_REPAIRS,
     API_DATA_LAST_UPDATE,
+    API_DATA_METRICS,
     API_DATA_SOCKET_IO_VERSION,
     API_DATA_USER_ID,
-    ATTR_EVENT_TYPE,
-    ATTR_IS_ON,
     ATTR_MONITOR_GROUP_ID,
     ATTR_MONITOR_ID,
     DISCONNECT_INTERVAL,
-    INVALID_JSON_FORMATS,
     MAX_MSG_SIZE,
     PLUG_SENSOR_TYPE,
     SHINOBI_EVENT,
@@ -38,29 +38,33 @@ from ..common.consts import (
     SHINOBI_WS_ENDPOINT,
     SHINOBI_WS_PING_MESSAGE,
     SHINOBI_WS_PONG_MESSAGE,
+    SIGNAL_MONITOR_RECORDING_ADDED,
     SIGNAL_MONITOR_STATUS_CHANGED,
     SIGNAL_MONITOR_TRIGGER,
     SIGNAL_WS_READY,
     SIGNAL_WS_STATUS,
-    TRIGGER_DEFAULT,
     TRIGGER_DETAILS,
     TRIGGER_DETAILS_PLUG,
     TRIGGER_DETAILS_REASON,
-    TRIGGER_INTERVAL,
     TRIGGER_NAME,
-    TRIGGER_PLUG,
     TRIGGER_STARTS_WITH,
-    TRIGGER_TIMESTAMP,
     URL_PARAMETER_BASE_URL,
     URL_PARAMETER_VERSION,
     WS_CLOSING_MESSAGE,
     WS_COMPRESSION_DEFLATE,
     WS_EVENT_ACTION_PING,
+    WS_EVENT_CONTROL,
     WS_EVENT_DETECTOR_TRIGGER,
     WS_EVENT_LOG,
     WS_EVENT_MONITOR_STATUS,
+    WS_EVENT_UNKNOWN,
+    WS_EVENT_VIDEO_BUILD_SUCCESS,
     WS_TIMEOUT,
 )
+from ..common.json_decoder import decode_json
+from ..models.socket_io_packet import SocketIOPacket
+from ..models.trigger_state import TriggerState, TriggerStates
+from ..models.websocket_metrics import WebSocketMetrics
 from .config_manager import ConfigManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -68,7 +72,7 @@ _LOGGER = logging.getLogger(__name__)
 
 class WebSockets:
     _session: ClientSession | None
-    _triggered_sensors: dict
+    _trigger_states: TriggerStates
     _api_data: dict
     _config_manager: ConfigManager
     _allowed_handlers: list[str]
@@ -80,21 +84,23 @@ class WebSockets:
         self,
         hass: HomeAssistant | None,
         config_manager: ConfigManager,
+        session: ClientSession | None = None,
     ):
         try:
             self._hass = hass
             self._config_manager = config_manager
 
             self._status = None
-            self._session = None
+            self._session = session
 
             self._base_url = None
             self._pending_payloads = []
             self._ws = None
             self._api_data = {}
             self._data = {}
-            self._triggered_sensors = {}
-            self._remove_async_track_time = None
+            self._last_update = None
+            self._metrics = WebSocketMetrics()
+            self._trigger_states = TriggerStates()
 
             self._local_async_dispatcher_send = None
 
@@ -109,6 +115,7 @@ class WebSockets:
                 WS_EVENT_LOG: self._handle_log,
                 WS_EVENT_DETECTOR_TRIGGER: self._handle_detector_trigger,
                 WS_EVENT_MONITOR_STATUS: self._handle_monitor_status_changed,
+                WS_EVENT_VIDEO_BUILD_SUCCESS: self._handle_video_build_success,
             }
 
             self._allowed_handlers = []
@@ -123,8 +130,23 @@ class WebSockets:
 
     @property
     def data(self) -> dict:
+        if self._last_update is not None:
+            last_update = datetime.fromtimestamp(self._last_update)
+
+            self._data[API_DATA_LAST_UPDATE] = last_update.isoformat()
+
+        self._data[API_DATA_JSON_REPAIRS] = self._metrics.json_repairs
+        self._data[API_DATA_DROPPED_EVENTS] = self._metrics.dropped
+        self._data[API_DATA_METRICS] = self._metrics.to_dict()
+
         return self._data
 
+    @property
+    def metrics(self) -> WebSocketMetrics:
+        metrics = self._metrics
+
+        return metrics
+
     @property
     def status(self) -> str | None:
         status = self._status
@@ -139,6 +161,13 @@ class WebSockets:
     def _has_running_loop(self):
         return self._hass.loop is not None and not self._hass.loop.is_closed()
 
+    @property
+    def _can_receive(self) -> bool:
+        is_connected = self._status == ConnectivityStatus.Connected
+        session_is_open = self._session is not None and not self._session.closed
+
+        return is_connected and session_is_open
+
     @property
     def version(self):
         return self._api_data.get(API_DATA_SOCKET_IO_VERSION, 3)
@@ -163,17 +192,6 @@ class WebSockets:
             _LOGGER.debug(f"Initializing, Mode: {self._is_home_assistant}")
             self._allowed_handlers = list(self._handlers.keys())
 
-            if self._is_home_assistant:
-                self._remove_async_track_time = async_track_time_interval(
-                    self._hass, self._check_triggers, TRIGGER_INTERVAL
-                )
-
-            else:
-                loop = asyncio.get_running_loop()
-                loop.call_later(
-                    TRIGGER_INTERVAL.total_seconds(), self._check_triggers, None
-                )
-
             await self._initialize_session()
 
             config_data = self._config_manager.config_data
@@ -223,9 +241,8 @@ class WebSockets:
                 self._set_status(ConnectivityStatus.Failed)
 
     async def terminate(self):
-        if self._remove_async_track_time is not None:
-            self._remove_async_track_time()
-            self._remove_async_track_time = None
+        # Pending expiry timers would turn off sensors of a reloaded entry
+        self._trigger_states.clear()
 
         if self._ws is not None:
             await self._ws.close()
@@ -236,6 +253,9 @@ class WebSockets:
         self._ws = None
 
     async def _initialize_session(self):
+        if self._session is not None and not self._session.closed:
+            return
+
         try:
             if self._is_home_assistant:
                 self._session = async_create_clientsession(hass=self._hass)
@@ -257,29 +277,19 @@ class WebSockets:
         _LOGGER.info("Starting to listen connected")
 
         async for msg in self._ws:
-            is_ha_running = self._hass.is_running
-            is_connected = self.status == ConnectivityStatus.Connected
-            is_closing_type = msg.type in WS_CLOSING_MESSAGE
-            is_error = msg.type == aiohttp.WSMsgType.ERROR
-            can_try_parse_message = msg.type == aiohttp.WSMsgType.TEXT
-            is_closing_data = (
-                False if is_closing_type or is_error else msg.data == "close"
-            )
-            session_is_closed = self._session is None or self._session.closed
-
-            not_connected = True in [
-                is_closing_type,
-                is_error,
-                is_closing_data,
-                session_is_closed,
-                not is_connected,
-            ]
-
-            if not is_ha_running:
+            if not self._hass.is_running:
                 self._set_status(ConnectivityStatus.Disconnected)
                 return
 
-            elif not_connected:
+            msg_type = msg.type
+
+            is_closing = (
+                msg_type in WS_CLOSING_MESSAGE
+                or msg_type == aiohttp.WSMsgType.ERROR
+                or msg.data == "close"
+            )
+
+            if is_closing or not self._can_receive:
                 _LOGGER.warning(
                     f"WS stopped listening, "
                     f"Message: {str(msg)}, "
@@ -289,30 +299,25 @@ class WebSockets:
                 self._set_status(ConnectivityStatus.NotConnected)
                 return
 
-            elif can_try_parse_message:
-                self.data[API_DATA_LAST_UPDATE] = datetime.now().isoformat()
+            if msg_type == aiohttp.WSMsgType.TEXT:
+                self._last_update = time()
 
                 await self._parse_message(msg.data)
 
     async def _parse_message(self, message: str):
         try:
-            all_keys = self._messages_handler.keys()
+            packet = SocketIOPacket(message)
 
-            message_handler = None
-            current_key = None
+            message_handler = self._messages_handler.get(packet.key)
 
-            for key in all_keys:
-                if f"{key}[" in message or f"{key}{{" in message or key == message:
-                    current_key = key
-                    message_handler = self._messages_handler.get(current_key)
+            if packet.key != SHINOBI_WS_ACTION_MESSAGE:
+                self._metrics.add_frame(WS_EVENT_CONTROL, len(message))
 
             if message_handler is None:
                 _LOGGER.debug(f"No message handler available, Message: {message}")
 
             else:
-                message_data = message.replace(current_key, "")
-
-                await message_handler(current_key, message_data)
+                await message_handler(packet.key, packet.payload)
 
         except Exception as ex:
             _LOGGER.error(
@@ -340,13 +345,36 @@ class WebSockets:
         await self._send_connect_message()
 
     async def _handle_action_message(self, prefix, data):
+        event_type = self._get_event_type(data)
+
+        self._metrics.add_frame(event_type or WS_EVENT_UNKNOWN, len(data))
+
+        if event_type is not None and event_type not in self._allowed_handlers:
+            self._drop_event(event_type)
+            return
+
+        max_frame_size = self._config_manager.max_frame_size
+
+        if 0 < max_frame_size < len(data):
+            _LOGGER.debug(
+                f"Ignoring oversized event message, Key: {event_type}, Size: {len(data)}"
+            )
+
+            self._drop_event(event_type)
+            return
+
         try:
-            for bad_format in INVALID_JSON_FORMATS.keys():
-                if bad_format in data:
-                    fixed_format = INVALID_JSON_FORMATS[bad_format]
-                    data = str(data).replace(bad_format, fixed_format)
+            started = perf_counter()
+
+            payload, is_repaired = decode_json(data)
+
+            self._metrics.add_decode_time(
+                event_type or WS_EVENT_UNKNOWN, perf_counter() - started
+            )
+
+            if is_repaired:
+                self._metrics.json_repairs += 1
 
-            payload = json.loads(data)
             action = payload[0]
             data = payload[1]
 
@@ -361,8 +389,12 @@ class WebSockets:
                     handler: Callable = self._handlers.get(func)
 
                     if handler is not None:
+                        started = perf_counter()
+
                         await handler(data)
 
+                        self._metrics.add_handler_time(func, perf_counter() - started)
+
                 elif func != WS_EVENT_LOG:
                     _LOGGER.debug(f"Payload ({prefix}) received, Type: {func}")
 
@@ -391,20 +423,30 @@ class WebSockets:
                 )
 
             else:
-                key = "Unknown"
-                unsupported_data = str(data[0:50])
-
-                if unsupported_data.startswith(TRIGGER_STARTS_WITH):
-                    key_tmp = unsupported_data.replace(TRIGGER_STARTS_WITH, "")
-                    key_arr = key_tmp.split('"')
-
-                    if len(key_arr) > 0:
-                        key = key_arr[0]
+                key = self._get_event_type(data[0:50]) or WS_EVENT_UNKNOWN
 
                 _LOGGER.debug(
-                    f"Ignoring unsupported event message, Key: {key}, Data: {unsupported_data}"
+                    f"Ignoring unsupported event message, Key: {key}, Data: {data[0:50]}"
                 )
 
+    @staticmethod
+    def _get_event_type(data: str) -> str | None:
+        event_type = None
+
+        if data.startswith(TRIGGER_STARTS_WITH):
+            start_position = len(TRIGGER_STARTS_WITH)
+            end_position = data.find('"', start_position)
+
+            if end_position > -1:
+                event_type = data[start_position:end_position]
+
+        return event_type
+
+    def _drop_event(self, event_type: str | None):
+        key = WS_EVENT_UNKNOWN if event_type is None else event_type
+
+        self._metrics.add_dropped(key)
+
     async def _handle_log(self, data):
         monitor_id = data.get(ATTR_MONITOR_ID)
         log = data.get("log", {})
@@ -438,17 +480,14 @@ class WebSockets:
                 if trigger_name is None:
                     trigger_name = trigger_details.get(TRIGGER_NAME)
 
-                event_data = {
-                    ATTR_MONITOR_ID: monitor_id,
-                    ATTR_EVENT_TYPE: sensor_type,
-                    TRIGGER_NAME: trigger_name,
-                    TRIGGER_PLUG: trigger_plug,
-                    TRIGGER_DETAILS_REASON: trigger_reason,
-                    ATTR_IS_ON: True,
-                    TRIGGER_TIMESTAMP: datetime.now().timestamp(),
-                }
+                state = self._trigger_states.get_or_create(monitor_id, sensor_type)
+                state.name = trigger_name
+                state.plug = trigger_plug
+                state.reason = trigger_reason
 
-                self._set_trigger_data(monitor_id, sensor_type, event_data)
+                self._set_trigger_state(state, True)
+
+                self._schedule_trigger_expiry(state)
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -468,6 +507,14 @@ class WebSockets:
             SIGNAL_MONITOR_STATUS_CHANGED, monitor_id, status_code
         )
 
+    async def _handle_video_build_success(self, data):
+        _LOGGER.debug(f"Recording added event received, Data: {data}")
+
+        monitor_id = data.get(ATTR_MONITOR_ID)
+
+        if monitor_id is not None:
+            self._async_dispatcher_send(SIGNAL_MONITOR_RECORDING_ADDED, monitor_id)
+
     async def _send_connect_message(self):
         message_data = [
             "f",
@@ -529,94 +576,48 @@ class WebSockets:
         else:
             _LOGGER.info(f"Firing event {event_name}, Payload: {data}")
 
-    @callback
-    def _check_triggers(self, now):
-        if self._is_home_assistant:
-            self._hass.async_create_task(self._async_check_triggers(now))
+    def _schedule_trigger_expiry(self, state: TriggerState):
+        if state.timer is not None:
+            state.timer.cancel()
 
-        else:
-            loop = asyncio.get_running_loop()
-            loop.create_task(self._async_check_triggers(datetime.now()))
+        loop = asyncio.get_running_loop()
+        event_duration = self._config_manager.get_event_duration(state.event_type)
 
-            loop.call_later(
-                TRIGGER_INTERVAL.total_seconds(),
-                self._async_check_triggers,
-                datetime.now(),
-            )
+        state.timer = loop.call_at(
+            loop.time() + event_duration, self._on_trigger_expired, state
+        )
 
-    async def _async_check_triggers(self, event_time):
+    @callback
+    def _on_trigger_expired(self, state: TriggerState):
         try:
-            current_time = datetime.now().timestamp()
-
-            keys = [
-                key
-                for key in self._triggered_sensors
-                if self._triggered_sensors.get(key).get(ATTR_IS_ON, False)
-            ]
-
-            _LOGGER.debug(f"Checking event's triggers, Identified: {len(keys)}")
-
-            for key in keys:
-                event_data = self._triggered_sensors.get(key)
+            state.timer = None
 
-                monitor_id = event_data.get(ATTR_MONITOR_ID)
-                event_type = event_data.get(ATTR_EVENT_TYPE)
-                trigger_timestamp = event_data.get(TRIGGER_TIMESTAMP)
-
-                diff = current_time - trigger_timestamp
-                event_duration = self._config_manager.get_event_duration(event_type)
-
-                if diff >= event_duration:
-                    event_data[ATTR_IS_ON] = False
-                    event_data[TRIGGER_TIMESTAMP] = current_time
-
-                    self._set_trigger_data(monitor_id, event_type, event_data)
+            if state.is_on:
+                self._set_trigger_state(state, False)
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
 
             _LOGGER.error(
-                f"Failed to check triggers (async) at {event_time}, Error: {ex}, Line: {line_number}"
+                f"Failed to expire trigger, Data: {state}, Error: {ex}, Line: {line_number}"
             )
 
-    @staticmethod
-    def _get_trigger_key(monitor_id: str, event_type: str) -> str:
-        key = f"{monitor_id}::{event_type}"
-
-        return key
-
-    def _set_trigger_data(self, monitor_id: str, event_type: str, data: dict):
-        key = self._get_trigger_key(monitor_id, event_type)
-
-        _LOGGER.debug(f"Set {key}, Data: {data}")
+    def _set_trigger_state(self, state: TriggerState, is_on: bool):
+        changed = self._trigger_states.set_state(state, is_on, time())
 
-        previous_trigger_state = self.get_trigger_state(monitor_id, event_type)
+        _LOGGER.debug("Update trigger, Data: %s", state)
 
-        self._triggered_sensors[key] = data
-
-        _LOGGER.debug(
-            "Update trigger, "
-            f"Monitor: {monitor_id}, "
-            f"Event: {event_type}, "
-            f"Data: {data}"
-        )
-
-        current_trigger_state = data.get(ATTR_IS_ON)
-
-        if previous_trigger_state != current_trigger_state:
+        if changed:
             self._async_dispatcher_send(
                 SIGNAL_MONITOR_TRIGGER,
-                monitor_id,
-                event_type,
-                current_trigger_state,
+                state.monitor_id,
+                state.event_type,
+                is_on,
             )
 
     def get_trigger_state(self, monitor_id: str, event_type: str) -> bool:
-        key = self._get_trigger_key(monitor_id, event_type)
-
-        data = self._triggered_sensors.get(key, TRIGGER_DEFAULT)
-        state = data.get(ATTR_IS_ON, False)
+        state = self._trigger_states.is_on(monitor_id, event_type)
 
         return state
 
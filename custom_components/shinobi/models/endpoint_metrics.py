@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from time import perf_counter
+
+from ..common.consts import LATENCY_BUCKETS
+from .histogram import Histogram
+
+
+class EndpointMetrics:
+    """Latency, status codes, bytes and in-flight requests of an endpoint.
+
+    Latency is kept since startup and for the current window, the window is
+    swapped on every sensors update.
+    """
+
+    __slots__ = (
+        "latency",
+        "window_latency",
+        "status_codes",
+        "errors",
+        "bytes_received",
+        "in_flight",
+    )
+
+    latency: Histogram
+    window_latency: Histogram
+    status_codes: dict[int, int]
+    errors: int
+    bytes_received: int
+    in_flight: int
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.window_latency = Histogram(LATENCY_BUCKETS)
+        self.status_codes = {}
+        self.errors = 0
+        self.bytes_received = 0
+        self.in_flight = 0
+
+    @property
+    def failures(self) -> int:
+        failures = self.errors + sum(
+            count for status, count in self.status_codes.items() if status >= 400
+        )
+
+        return failures
+
+    def start(self) -> float:
+        self.in_flight += 1
+
+        return perf_counter()
+
+    def stop(self, started: float):
+        self.in_flight -= 1
+
+        duration = (perf_counter() - started) * 1000
+
+        self.latency.record(duration)
+        self.window_latency.record(duration)
+
+    def swap_window(self) -> Histogram:
+        """Latency of the window that ended, a new window starts."""
+        window_latency = self.window_latency
+
+        self.window_latency = Histogram(LATENCY_BUCKETS)
+
+        return window_latency
+
+    def set_response(self, status: int, bytes_received: int | None):
+        self.status_codes[status] = self.status_codes.get(status, 0) + 1
+
+        if bytes_received is not None:
+            self.bytes_received += bytes_received
+
+    def to_dict(self):
+        obj = {
+            "latency": self.latency.to_dict(),
+            "status_codes": self.status_codes,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "in_flight": self.in_flight,
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
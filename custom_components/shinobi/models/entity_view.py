@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from homeassistant.core import CALLBACK_TYPE
+
+from ..common.entity_descriptions import IntegrationEntityDescription
+
+
+class EntityView:
+    """Cached data of an entity key for a monitor (or the server).
+
+    The version increases whenever the data changes, entities compare it to the
+    version they have rendered instead of comparing the data.
+    """
+
+    __slots__ = ("entity_description", "monitor_id", "data", "version", "listeners")
+
+    entity_description: IntegrationEntityDescription
+    monitor_id: str | None
+    data: dict | None
+    version: int
+    listeners: list[CALLBACK_TYPE]
+
+    def __init__(
+        self, entity_description: IntegrationEntityDescription, monitor_id: str | None
+    ):
+        self.entity_description = entity_description
+        self.monitor_id = monitor_id
+        self.data = None
+        self.version = 0
+        self.listeners = []
+
+    @property
+    def key(self) -> str:
+        key = self.entity_description.key
+
+        return key
+
+    def update(self, data: dict | None) -> bool:
+        """Set the data, returns whether it changed."""
+        if self.version > 0 and data == self.data:
+            return False
+
+        self.data = data
+        self.version += 1
+
+        return True
+
+    def to_dict(self):
+        obj = {
+            "key": self.key,
+            "monitor_id": self.monitor_id,
+            "version": self.version,
+            "data": self.data,
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+
+
+class Histogram:
+    """Fixed buckets histogram, counts are kept in an array.
+
+    The last bucket counts the values above the highest bound.
+    """
+
+    __slots__ = ("_bounds", "_counts", "count", "total")
+
+    _bounds: tuple[float, ...]
+    _counts: array
+    count: int
+    total: float
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self._bounds = bounds
+        self._counts = array("Q", [0] * (len(bounds) + 1))
+        self.count = 0
+        self.total = 0
+
+    @property
+    def average(self) -> float | None:
+        average = None if self.count == 0 else self.total / self.count
+
+        return average
+
+    def record(self, value: float):
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: Histogram):
+        """Add the counts of a histogram with the same bounds."""
+        for index, count in enumerate(other._counts):
+            self._counts[index] += count
+
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, percentile: float) -> float | None:
+        """Upper bound of the bucket holding the percentile (capped at the highest
+        bound), None when empty.
+        """
+        if self.count == 0:
+            return None
+
+        rank = self.count * percentile / 100
+        accumulated = 0
+
+        for index, count in enumerate(self._counts):
+            accumulated += count
+
+            if accumulated >= rank:
+                break
+
+        bounds = self._bounds
+        result = bounds[min(index, len(bounds) - 1)]
+
+        return result
+
+    def to_dict(self):
+        bounds = [str(bound) for bound in self._bounds] + [f">{self._bounds[-1]}"]
+
+        obj = {
+            "count": self.count,
+            "average": self.average,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(bounds, self._counts.tolist())),
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from time import monotonic
+
+
+class ListingCacheItem:
+    """Video browser listing of a monitor and day, valid until it expires."""
+
+    __slots__ = ("monitor_id", "date", "data", "expires_at")
+
+    monitor_id: str | None
+    date: str | None
+    data: list[dict]
+    expires_at: float
+
+    def __init__(
+        self, monitor_id: str | None, date: str | None, data: list[dict], ttl: float
+    ):
+        self.monitor_id = monitor_id
+        self.date = date
+        self.data = data
+        self.expires_at = monotonic() + ttl
+
+    @property
+    def is_expired(self) -> bool:
+        is_expired = monotonic() >= self.expires_at
+
+        return is_expired
+
+    def to_dict(self):
+        obj = {
+            "monitor_id": self.monitor_id,
+            "date": self.date,
+            "items": len(self.data),
+            "expires_in": self.expires_at - monotonic(),
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
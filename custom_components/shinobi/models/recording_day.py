@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+
+class RecordingDay:
+    """Number and total size of the recordings of a monitor on a day."""
+
+    __slots__ = ("date", "count", "size")
+
+    date: str
+    count: int
+    size: int
+
+    def __init__(self, date: str):
+        self.date = date
+        self.count = 0
+        self.size = 0
+
+    def add(self, size: int):
+        self.count += 1
+        self.size += size
+
+    def to_dict(self):
+        obj = {
+            "date": self.date,
+            "count": self.count,
+            "size": self.size,
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+class ResponseCacheItem:
+    """Validators and decoded data of the last response of a URL."""
+
+    __slots__ = ("etag", "last_modified", "fingerprint", "size", "data")
+
+    etag: str | None
+    last_modified: str | None
+    fingerprint: bytes
+    size: int
+    data: Any
+
+    def __init__(
+        self,
+        etag: str | None,
+        last_modified: str | None,
+        fingerprint: bytes,
+        size: int,
+        data: Any,
+    ):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fingerprint = fingerprint
+        self.size = size
+        self.data = data
+
+    def to_dict(self):
+        obj = {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "fingerprint": self.fingerprint.hex(),
+            "size": self.size,
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
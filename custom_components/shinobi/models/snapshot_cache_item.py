@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from hashlib import blake2b
+from time import monotonic
+
+
+class SnapshotCacheItem:
+    __slots__ = ("monitor_id", "data", "etag", "variants", "fetched_at")
+
+    monitor_id: str
+    data: bytes
+    etag: str
+    variants: dict[int, bytes]
+    fetched_at: float
+
+    def __init__(self, monitor_id: str, data: bytes):
+        self.monitor_id = monitor_id
+        self.data = data
+        self.etag = f'"{blake2b(data, digest_size=16).hexdigest()}"'
+        self.variants = {}
+        self.fetched_at = monotonic()
+
+    @property
+    def size(self) -> int:
+        size = len(self.data) + sum(len(variant) for variant in self.variants.values())
+
+        return size
+
+    @property
+    def age(self) -> float:
+        age = monotonic() - self.fetched_at
+
+        return age
+
+    def to_dict(self):
+        obj = {
+            "monitor_id": self.monitor_id,
+            "etag": self.etag,
+            "size": self.size,
+            "variants": list(self.variants.keys()),
+            "age": self.age,
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
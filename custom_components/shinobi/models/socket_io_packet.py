@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from ..common.consts import (
+    ENGINE_IO_PACKET_MESSAGE,
+    SOCKET_IO_NAMESPACE_PREFIX,
+    SOCKET_IO_NAMESPACE_SEPARATOR,
+)
+
+
+class SocketIOPacket:
+    """Engine.IO / Socket.IO text frame, decoded from its header only.
+
+    Frame layout: <Engine.IO type>[<Socket.IO type>][/<namespace>,][<ack id>]<payload>
+    """
+
+    __slots__ = ("engine_io_type", "socket_io_type", "key", "payload")
+
+    engine_io_type: str | None
+    socket_io_type: str | None
+    key: str | None
+    payload: str
+
+    def __init__(self, message: str):
+        self.engine_io_type = None
+        self.socket_io_type = None
+        self.key = None
+        self.payload = ""
+
+        message_length = len(message)
+
+        if message_length == 0 or not message[0].isdigit():
+            return
+
+        self.engine_io_type = message[0]
+        position = 1
+
+        if (
+            self.engine_io_type == ENGINE_IO_PACKET_MESSAGE
+            and message_length > 1
+            and message[1].isdigit()
+        ):
+            self.socket_io_type = message[1]
+            position = 2
+
+            if message.startswith(SOCKET_IO_NAMESPACE_PREFIX, position):
+                separator = message.find(SOCKET_IO_NAMESPACE_SEPARATOR, position)
+                position = message_length if separator == -1 else separator + 1
+
+            while position < message_length and message[position].isdigit():
+                position += 1
+
+        self.key = message[0:2] if self.socket_io_type is not None else message[0]
+
+        if position < message_length:
+            self.payload = message[position:]
+
+    def __repr__(self):
+        to_string = (
+            f"{{'key': {self.key}, "
+            f"'engine_io_type': {self.engine_io_type}, "
+            f"'socket_io_type': {self.socket_io_type}, "
+            f"'payload_size': {len(self.payload)}}}"
+        )
+
+        return to_string
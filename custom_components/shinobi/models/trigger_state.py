@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from asyncio import TimerHandle
+import sys
+
+from ..common.consts import (
+    ATTR_EVENT_TYPE,
+    ATTR_IS_ON,
+    ATTR_MONITOR_ID,
+    TRIGGER_DETAILS_REASON,
+    TRIGGER_NAME,
+    TRIGGER_PLUG,
+    TRIGGER_TIMESTAMP,
+)
+
+
+class TriggerState:
+    __slots__ = (
+        "monitor_id",
+        "event_type",
+        "name",
+        "plug",
+        "reason",
+        "is_on",
+        "timestamp",
+        "timer",
+    )
+
+    monitor_id: str
+    event_type: str
+    name: str | None
+    plug: str | None
+    reason: str | None
+    is_on: bool
+    timestamp: float
+    timer: TimerHandle | None
+
+    def __init__(self, monitor_id: str, event_type: str):
+        self.monitor_id = monitor_id
+        self.event_type = event_type
+        self.name = None
+        self.plug = None
+        self.reason = None
+        self.is_on = False
+        self.timestamp = 0
+        self.timer = None
+
+    def to_dict(self):
+        obj = {
+            ATTR_MONITOR_ID: self.monitor_id,
+            ATTR_EVENT_TYPE: self.event_type,
+            TRIGGER_NAME: self.name,
+            TRIGGER_PLUG: self.plug,
+            TRIGGER_DETAILS_REASON: self.reason,
+            ATTR_IS_ON: self.is_on,
+            TRIGGER_TIMESTAMP: self.timestamp,
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
+
+
+class TriggerStates:
+    """Trigger state per (monitor, event type), tracking the active ones."""
+
+    __slots__ = ("_states", "_active")
+
+    _states: dict[tuple[str, str], TriggerState]
+    _active: set[tuple[str, str]]
+
+    def __init__(self):
+        self._states = {}
+        self._active = set()
+
+    @property
+    def active(self) -> list[TriggerState]:
+        states = self._states
+        active = [states[key] for key in self._active]
+
+        return active
+
+    def get(self, monitor_id: str, event_type: str) -> TriggerState | None:
+        state = self._states.get((monitor_id, event_type))
+
+        return state
+
+    def is_on(self, monitor_id: str, event_type: str) -> bool:
+        is_on = (monitor_id, event_type) in self._active
+
+        return is_on
+
+    def get_or_create(self, monitor_id: str, event_type: str) -> TriggerState:
+        key = (monitor_id, event_type)
+        state = self._states.get(key)
+
+        if state is None:
+            monitor_id = sys.intern(monitor_id)
+            key = (monitor_id, event_type)
+
+            state = TriggerState(monitor_id, event_type)
+
+            self._states[key] = state
+
+        return state
+
+    def set_state(self, state: TriggerState, is_on: bool, timestamp: float) -> bool:
+        """Set the state, returns whether it changed."""
+        key = (state.monitor_id, state.event_type)
+        changed = state.is_on != is_on
+
+        state.is_on = is_on
+        state.timestamp = timestamp
+
+        if is_on:
+            self._active.add(key)
+
+        else:
+            self._active.discard(key)
+
+        return changed
+
+    def clear(self):
+        for state in self._states.values():
+            if state.timer is not None:
+                state.timer.cancel()
+                state.timer = None
+
+        self._states.clear()
+        self._active.clear()
+
+    def __len__(self):
+        return len(self._states)
+
+    def __repr__(self):
+        to_string = f"{[state.to_dict() for state in self._states.values()]}"
+
+        return to_string
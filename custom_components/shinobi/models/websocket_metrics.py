@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from time import monotonic
+
+from ..common.consts import WS_METRICS_RATE_WINDOW, WS_TIMING_BUCKETS
+from .histogram import Histogram
+
+
+class WebSocketMetrics:
+    """Frames, bytes, decode and handler time per event type of the WebSocket.
+
+    Handler time of all event types is kept for the current window as well,
+    the window is swapped on every sensors update.
+    """
+
+    __slots__ = (
+        "frames",
+        "bytes",
+        "dropped",
+        "json_repairs",
+        "decode_time",
+        "handler_time",
+        "window_handler_time",
+        "_frames_per_second",
+        "_window_started",
+        "_window_frames",
+    )
+
+    frames: dict[str, int]
+    bytes: dict[str, int]
+    dropped: dict[str, int]
+    json_repairs: int
+    decode_time: dict[str, Histogram]
+    handler_time: dict[str, Histogram]
+    window_handler_time: Histogram
+    _frames_per_second: float
+    _window_started: float
+    _window_frames: int
+
+    def __init__(self):
+        self.frames = {}
+        self.bytes = {}
+        self.dropped = {}
+        self.json_repairs = 0
+        self.decode_time = {}
+        self.handler_time = {}
+        self.window_handler_time = Histogram(WS_TIMING_BUCKETS)
+        self._frames_per_second = 0
+        self._window_started = monotonic()
+        self._window_frames = 0
+
+    @property
+    def frames_per_second(self) -> float:
+        """Rate of the last completed window, 0 when no frame arrived since."""
+        elapsed = monotonic() - self._window_started
+        is_stale = elapsed >= WS_METRICS_RATE_WINDOW.total_seconds() * 2
+
+        frames_per_second = 0 if is_stale else self._frames_per_second
+
+        return frames_per_second
+
+    def add_frame(self, event_type: str, size: int):
+        self.frames[event_type] = self.frames.get(event_type, 0) + 1
+        self.bytes[event_type] = self.bytes.get(event_type, 0) + size
+
+        self._window_frames += 1
+
+        now = monotonic()
+        elapsed = now - self._window_started
+
+        if elapsed >= WS_METRICS_RATE_WINDOW.total_seconds():
+            self._frames_per_second = self._window_frames / elapsed
+
+            self._window_started = now
+            self._window_frames = 0
+
+    def add_dropped(self, event_type: str):
+        self.dropped[event_type] = self.dropped.get(event_type, 0) + 1
+
+    def add_decode_time(self, event_type: str, duration: float):
+        self._get_histogram(self.decode_time, event_type).record(duration * 1000)
+
+    def add_handler_time(self, event_type: str, duration: float):
+        self._get_histogram(self.handler_time, event_type).record(duration * 1000)
+        self.window_handler_time.record(duration * 1000)
+
+    def swap_handler_time_window(self) -> Histogram:
+        """Handler time of the window that ended, a new window starts."""
+        window_handler_time = self.window_handler_time
+
+        self.window_handler_time = Histogram(WS_TIMING_BUCKETS)
+
+        return window_handler_time
+
+    @staticmethod
+    def _get_histogram(histograms: dict[str, Histogram], event_type: str) -> Histogram:
+        histogram = histograms.get(event_type)
+
+        if histogram is None:
+            histogram = Histogram(WS_TIMING_BUCKETS)
+
+            histograms[event_type] = histogram
+
+        return histogram
+
+    def to_dict(self):
+        obj = {
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "dropped": self.dropped,
+            "json_repairs": self.json_repairs,
+            "frames_per_second": self.frames_per_second,
+            "decode_time": {
+                event_type: histogram.to_dict()
+                for event_type, histogram in self.decode_time.items()
+            },
+            "handler_time": {
+                event_type: histogram.to_dict()
+                for event_type, histogram in self.handler_time.items()
+            },
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
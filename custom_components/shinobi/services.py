@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from functools import partial
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+import homeassistant.helpers.config_validation as cv
+
+from .common.consts import (
+    ATTR_DETECTOR,
+    ATTR_ENABLED,
+    ATTR_GROUP,
+    ATTR_MODE,
+    ATTR_MONITORS,
+    DOMAIN,
+    MONITOR_DETECTORS,
+    SERVICE_SET_DETECTION,
+    SERVICE_SET_MODE,
+)
+from .common.enums import MonitorMode
+from .managers.coordinator import Coordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+MONITORS_SCHEMA = {
+    vol.Exclusive(ATTR_MONITORS, ATTR_MONITORS): vol.All(cv.ensure_list, [cv.string]),
+    vol.Exclusive(ATTR_GROUP, ATTR_MONITORS): cv.string,
+}
+
+SET_DETECTION_SCHEMA = vol.Schema(
+    {
+        **MONITORS_SCHEMA,
+        vol.Required(ATTR_DETECTOR): vol.In(list(MONITOR_DETECTORS.keys())),
+        vol.Required(ATTR_ENABLED): cv.boolean,
+    }
+)
+
+SET_MODE_SCHEMA = vol.Schema(
+    {
+        **MONITORS_SCHEMA,
+        vol.Required(ATTR_MODE): vol.In(MonitorMode.get_list()),
+    }
+)
+
+
+def _get_coordinators(hass: HomeAssistant) -> list[Coordinator]:
+    coordinators = list(hass.data.get(DOMAIN, {}).values())
+
+    return coordinators
+
+
+def _get_monitor_ids(coordinator: Coordinator, service_call: ServiceCall) -> list[str]:
+    """Monitors of the coordinator selected by the service call, all by default."""
+    monitor_ids = service_call.data.get(ATTR_MONITORS)
+    group_id = service_call.data.get(ATTR_GROUP)
+    monitors = coordinator.monitors
+
+    if monitor_ids is not None:
+        result = [monitor_id for monitor_id in monitor_ids if monitor_id in monitors]
+
+    elif group_id is not None:
+        result = [
+            monitor_id
+            for monitor_id in monitors
+            if monitors[monitor_id].group_id == group_id
+        ]
+
+    else:
+        result = list(monitors.keys())
+
+    return result
+
+
+def _get_response(service_call: ServiceCall, results: dict[str, bool]) -> dict:
+    monitor_ids = service_call.data.get(ATTR_MONITORS)
+
+    if monitor_ids is not None:
+        for monitor_id in monitor_ids:
+            if monitor_id not in results:
+                _LOGGER.warning(f"Monitor {monitor_id} was not found")
+
+                results[monitor_id] = False
+
+    response = {ATTR_MONITORS: results}
+
+    return response
+
+
+async def _async_set_detection(
+    hass: HomeAssistant, service_call: ServiceCall
+) -> ServiceResponse:
+    detector = MONITOR_DETECTORS[service_call.data[ATTR_DETECTOR]]
+    enabled = service_call.data[ATTR_ENABLED]
+
+    results = {}
+
+    for coordinator in _get_coordinators(hass):
+        monitor_ids = _get_monitor_ids(coordinator, service_call)
+
+        if monitor_ids:
+            coordinator_results = await coordinator.set_detection(
+                monitor_ids, detector, enabled
+            )
+
+            results.update(coordinator_results)
+
+    response = _get_response(service_call, results)
+
+    return response
+
+
+async def _async_set_mode(
+    hass: HomeAssistant, service_call: ServiceCall
+) -> ServiceResponse:
+    mode = service_call.data[ATTR_MODE]
+
+    results = {}
+
+    for coordinator in _get_coordinators(hass):
+        monitor_ids = _get_monitor_ids(coordinator, service_call)
+
+        if monitor_ids:
+            coordinator_results = await coordinator.set_monitors_mode(monitor_ids, mode)
+
+            results.update(coordinator_results)
+
+    response = _get_response(service_call, results)
+
+    return response
+
+
+def async_setup_services(hass: HomeAssistant):
+    """Register the services, handlers are bound to hass, not every supported
+    version of Home Assistant has it on the service call.
+    """
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_DETECTION,
+        partial(_async_set_detection, hass),
+        schema=SET_DETECTION_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_MODE,
+        partial(_async_set_mode, hass),
+        schema=SET_MODE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
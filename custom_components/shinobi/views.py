@@ -1,8 +1,13 @@
-from collections.abc import Mapping
+from __future__ import annotations
+
+from asyncio import Task, shield
+from collections.abc import AsyncIterator, Mapping
+from functools import partial
+from hashlib import blake2b
 from http import HTTPStatus
 from ipaddress import ip_address
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 from aiohttp import hdrs, web
@@ -13,38 +18,75 @@ from yarl import URL
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .common.consts import DOMAIN, PROXY_PREFIX
-from .managers.config_manager import ConfigManager
-from .models.config_data import ConfigData
+from .common.consts import (
+    DOMAIN,
+    IMMUTABLE_CACHE_CONTROL,
+    PROXY_PREFIX,
+    SNAPSHOT_CONTENT_TYPE,
+)
+from .common.enums import RequestPriority
 
-_LOGGER = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from .managers.coordinator import Coordinator
 
+_LOGGER = logging.getLogger(__name__)
 
-def async_setup(hass: HomeAssistant, config_manager: ConfigManager) -> None:
-    """Set up the views."""
-    session = async_get_clientsession(hass)
 
-    hass.http.register_view(ThumbnailsProxyView(config_manager, session))
-    hass.http.register_view(TimelapseThumbnailsProxyView(config_manager, session))
-    hass.http.register_view(RecordingProxyView(config_manager, session))
+def async_setup(hass: HomeAssistant) -> None:
+    """Set up the views, once for all entries."""
+    hass.http.register_view(ThumbnailsProxyView(hass))
+    hass.http.register_view(TimelapseThumbnailsProxyView(hass))
+    hass.http.register_view(RecordingProxyView(hass))
 
 
 class ProxyView(HomeAssistantView):  # type: ignore[misc]
-    """HomeAssistant view."""
+    """HomeAssistant view.
+
+    Requests to the server are limited per entry and queued by priority,
+    identical in-flight requests of small resources share one response.
+    """
 
-    _config_manager: ConfigManager
+    _hass: HomeAssistant
+    _pending: dict[str, Task]
     requires_auth = True
+    priority = RequestPriority.THUMBNAIL
+    coalesce_requests = False
 
-    def __init__(self, config_manager: ConfigManager, session: aiohttp.ClientSession):
+    def __init__(self, hass: HomeAssistant):
         """Initialize the frigate clips proxy view."""
-        self._session = session
-        self._config_manager = config_manager
+        self._hass = hass
+        self._pending = {}
+
+    def _get_coordinator(self, entry_id: str) -> Coordinator | None:
+        coordinator = self._hass.data.get(DOMAIN, {}).get(entry_id)
+
+        return coordinator
+
+    @staticmethod
+    def _is_etag_match(header: str | None, etag: str) -> bool:
+        """Whether an If-None-Match header matches the ETag."""
+        is_match = False
 
-    @property
-    def config_data(self) -> ConfigData:
-        return self._config_manager.config_data
+        if header is not None:
+            etags = [value.strip().removeprefix("W/") for value in header.split(",")]
+
+            is_match = etag in etags or "*" in etags
+
+        return is_match
+
+    @staticmethod
+    def _is_entry_monitor(coordinator: Coordinator, **kwargs: Any) -> bool:
+        """Whether the request is for a monitor of the coordinator's credentials."""
+        api = coordinator.api
+
+        is_entry_monitor = (
+            kwargs["api_key"] == api.api_key
+            and kwargs["group_id"] == api.group_id
+            and kwargs["monitor_id"] in coordinator.monitors
+        )
+
+        return is_entry_monitor
 
     def _create_path(self, **kwargs: Any) -> str | None:
         """Create path."""
@@ -76,9 +118,9 @@ class ProxyView(HomeAssistantView):  # type: ignore[misc]
         return {k: v for k, v in request.query.items() if k != "authSig"}
 
     @staticmethod
-    def _init_header(request: web.Request) -> CIMultiDict | dict[str, str]:
+    def _init_header(request: web.Request) -> CIMultiDict:
         """Create initial header."""
-        headers = {}
+        headers = CIMultiDict()
 
         # filter flags
         for name, value in request.headers.items():
@@ -126,9 +168,8 @@ class ProxyView(HomeAssistantView):  # type: ignore[misc]
         for name, value in response.headers.items():
             if name in (
                 hdrs.TRANSFER_ENCODING,
-                # Removing Content-Length header for streaming responses
-                #   prevents seeking from working for mp4 files
-                # hdrs.CONTENT_LENGTH,
+                # Content-Length, Content-Range and Accept-Ranges are kept,
+                #   seeking in mp4 files depends on them
                 hdrs.CONTENT_TYPE,
                 hdrs.CONTENT_ENCODING,
                 # Strips inbound CORS response headers since the aiohttp_cors
@@ -143,18 +184,138 @@ class ProxyView(HomeAssistantView):  # type: ignore[misc]
 
         return headers
 
+    def _update_request_header(
+        self, _request: web.Request, _headers: CIMultiDict, **_kwargs: Any
+    ) -> None:
+        """Adjust the header sent upstream."""
+
+    def _update_response(
+        self,
+        _request: web.Request,
+        _result: aiohttp.ClientResponse,
+        _response: web.StreamResponse,
+        **_kwargs: Any,
+    ) -> tuple[int, int | None]:
+        """Adjust the response, returns offset and length of the body to send."""
+        return 0, None
+
+    @staticmethod
+    async def _iter_content(
+        result: aiohttp.ClientResponse,
+        chunk_size: int,
+        offset: int,
+        length: int | None,
+    ) -> AsyncIterator[bytes]:
+        """Upstream body in chunks, limited to length bytes starting at offset."""
+        end = None if length is None else offset + length
+        position = 0
+
+        async for chunk in result.content.iter_chunked(chunk_size):
+            chunk_start = position
+            position += len(chunk)
+
+            if offset == 0 and end is None:
+                yield chunk
+
+            elif position > offset:
+                start = max(offset - chunk_start, 0)
+                stop = len(chunk) if end is None else min(end - chunk_start, len(chunk))
+
+                if stop > start:
+                    yield chunk[start:stop]
+
+            if end is not None and position >= end:
+                break
+
+    def _is_coalescable(self, request: web.Request) -> bool:
+        """Plain GET requests, conditional and range requests are sent as-is."""
+        is_coalescable = (
+            self.coalesce_requests
+            and request.method == hdrs.METH_GET
+            and not request.body_exists
+            and all(
+                name not in request.headers
+                for name in (
+                    hdrs.RANGE,
+                    hdrs.IF_RANGE,
+                    hdrs.IF_NONE_MATCH,
+                    hdrs.IF_MODIFIED_SINCE,
+                )
+            )
+        )
+
+        return is_coalescable
+
+    async def _async_get_coalesced(
+        self,
+        coordinator: Coordinator,
+        url: str,
+        params: Mapping[str, str],
+        headers: CIMultiDict,
+    ) -> web.Response:
+        key = str(URL(url).with_query(params))
+        task = self._pending.get(key)
+
+        if task is None:
+            task = self._hass.async_create_task(
+                self._async_fetch(coordinator, url, params, headers)
+            )
+
+            self._pending[key] = task
+
+            task.add_done_callback(partial(self._on_fetch_done, key))
+
+        else:
+            coordinator.request_limiter.coalesced += 1
+
+        # Shielded, a client that goes away does not cancel the fetch of the others
+        status, response_headers, content_type, body = await shield(task)
+
+        response = web.Response(status=status, headers=response_headers, body=body)
+        response.content_type = content_type
+
+        return response
+
+    def _on_fetch_done(self, key: str, task: Task):
+        self._pending.pop(key, None)
+
+        # Retrieved here, the fetch fails after all of its clients went away
+        if not task.cancelled():
+            task.exception()
+
+    async def _async_fetch(
+        self,
+        coordinator: Coordinator,
+        url: str,
+        params: Mapping[str, str],
+        headers: CIMultiDict,
+    ) -> tuple[int, dict[str, str], str, bytes]:
+        """Read the whole response, shared by all requests of the URL."""
+        async with coordinator.request_limiter.acquire(self.priority):
+            async with coordinator.session.get(
+                url, headers=headers, params=params, allow_redirects=False
+            ) as result:
+                body = await result.read()
+
+                response_headers = self._response_header(result)
+                response_headers.pop(hdrs.CONTENT_LENGTH, None)
+
+                return result.status, response_headers, result.content_type, body
+
     async def _handle_request(
         self,
         request: web.Request,
         **kwargs: Any,
     ) -> web.Response | web.StreamResponse:
         """Handle route for request."""
-        config_entry = self._config_manager.entry
-        if not config_entry:
+        coordinator = self._get_coordinator(kwargs["entry_id"])
+        if not coordinator:
             _LOGGER.error(f"Invalid request, Data: {request}")
 
             return web.Response(status=HTTPStatus.BAD_REQUEST)
 
+        config_entry = coordinator.config_manager.entry
+
         if not self._permit_request(request, config_entry, **kwargs):
             _LOGGER.error(f"Request blocked, Data: {request}")
 
@@ -166,29 +327,57 @@ class ProxyView(HomeAssistantView):  # type: ignore[misc]
 
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
-        url = str(URL(self.config_data.api_url) / full_path)
+        url = str(URL(coordinator.config_manager.config_data.api_url) / full_path)
 
-        data = await request.read()
         source_header = self._init_header(request)
+        self._update_request_header(request, source_header, **kwargs)
+
+        # Stream the request body upstream instead of buffering it
+        data = None
+        if request.body_exists:
+            data = request.content
+
+            if request.content_length is not None:
+                source_header[hdrs.CONTENT_LENGTH] = str(request.content_length)
+
+        params = self._get_query_params(request)
+
+        if self._is_coalescable(request):
+            return await self._async_get_coalesced(
+                coordinator, url, params, source_header
+            )
 
-        async with self._session.request(
-            request.method,
-            url,
-            headers=source_header,
-            params=self._get_query_params(request),
-            allow_redirects=False,
-            data=data,
-        ) as result:
+        chunk_size = coordinator.config_manager.proxy_chunk_size
+
+        # The slot is held until the response headers arrive, not while streaming
+        async with coordinator.request_limiter.acquire(self.priority):
+            result = await coordinator.session.request(
+                request.method,
+                url,
+                headers=source_header,
+                params=params,
+                allow_redirects=False,
+                data=data,
+            )
+
+        async with result:
             headers = self._response_header(result)
 
             # Stream response
             response = web.StreamResponse(status=result.status, headers=headers)
             response.content_type = result.content_type
 
+            offset, length = self._update_response(request, result, response, **kwargs)
+
             try:
                 await response.prepare(request)
-                async for data in result.content.iter_any():
-                    await response.write(data)
+
+                # write drains the transport once its buffer is full,
+                # a slow client holds back reading from upstream
+                async for chunk in self._iter_content(
+                    result, chunk_size, offset, length
+                ):
+                    await response.write(chunk)
 
             except (aiohttp.ClientError, aiohttp.ClientPayloadError) as err:
                 _LOGGER.debug("Stream error for %s: %s", request.rel_url, err)
@@ -205,6 +394,40 @@ class ThumbnailsProxyView(ProxyView):
     url = f"{PROXY_PREFIX}/{{api_key:.+}}/jpeg/{{group_id:.+}}/{{monitor_id:.+}}/s.jpg"
 
     name = f"api:{DOMAIN}:thumbnails"
+    coalesce_requests = True
+
+    async def get(
+        self,
+        request: web.Request,
+        **kwargs: Any,
+    ) -> web.Response | web.StreamResponse | web.WebSocketResponse:
+        """Serve the snapshot from the snapshot cache, proxy it otherwise.
+
+        Revalidation of the cached snapshot is answered without the server.
+        """
+        coordinator = self._get_coordinator(kwargs["entry_id"])
+
+        if coordinator is not None and self._is_entry_monitor(coordinator, **kwargs):
+            item = await coordinator.get_thumbnail(kwargs["monitor_id"])
+
+            if item is not None:
+                thumbnail_ttl = coordinator.config_manager.thumbnail_ttl
+
+                headers = {
+                    hdrs.ETAG: item.etag,
+                    hdrs.CACHE_CONTROL: f"private, max-age={int(thumbnail_ttl)}",
+                }
+
+                if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+
+                if self._is_etag_match(if_none_match, item.etag):
+                    return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+                return web.Response(
+                    body=item.data, content_type=SNAPSHOT_CONTENT_TYPE, headers=headers
+                )
+
+        return await super().get(request, **kwargs)
 
     def _create_path(self, **kwargs: Any) -> str | None:
         """Create path."""
@@ -221,6 +444,30 @@ class TimelapseThumbnailsProxyView(ProxyView):
     url = f"{PROXY_PREFIX}/{{api_key:.+}}/timelapse/{{group_id:.+}}/{{monitor_id:.+}}/{{date:.+}}/{{file:.*}}"
 
     name = f"api:{DOMAIN}:timelapse"
+    coalesce_requests = True
+
+    async def get(
+        self,
+        request: web.Request,
+        **kwargs: Any,
+    ) -> web.Response | web.StreamResponse | web.WebSocketResponse:
+        """Serve the frame from the timelapse disk cache, proxy it otherwise."""
+        coordinator = self._get_coordinator(kwargs["entry_id"])
+
+        if coordinator is not None and self._is_entry_monitor(coordinator, **kwargs):
+            data = await coordinator.get_timelapse_frame(
+                kwargs["monitor_id"], kwargs["date"], kwargs["file"]
+            )
+
+            if data is not None:
+                headers = {
+                    hdrs.CONTENT_TYPE: SNAPSHOT_CONTENT_TYPE,
+                    hdrs.CACHE_CONTROL: IMMUTABLE_CACHE_CONTROL,
+                }
+
+                return web.Response(body=data, headers=headers)
+
+        return await super().get(request, **kwargs)
 
     def _create_path(self, **kwargs: Any) -> str | None:
         """Create path."""
@@ -234,11 +481,25 @@ class TimelapseThumbnailsProxyView(ProxyView):
 
 
 class RecordingProxyView(ProxyView):
-    """A proxy for snapshots."""
+    """A proxy for recordings, supports HEAD, range and conditional requests.
+
+    Validators of the server are passed through, when it sends none the proxy
+    adds a weak ETag of the recording path and size, revalidation with it is
+    answered with 304 once the server confirmed the size.
+    """
 
     url = f"{PROXY_PREFIX}/{{api_key:.+}}/videos/{{group_id:.+}}/{{monitor_id:.+}}/{{file:.*}}"
 
     name = f"api:{DOMAIN}:videos"
+    priority = RequestPriority.RECORDING
+
+    async def head(
+        self,
+        request: web.Request,
+        **kwargs: Any,
+    ) -> web.Response | web.StreamResponse | web.WebSocketResponse:
+        """Route HEAD requests to service."""
+        return await self.get(request, **kwargs)
 
     def _create_path(self, **kwargs: Any) -> str | None:
         """Create path."""
@@ -248,3 +509,140 @@ class RecordingProxyView(ProxyView):
         file: str = kwargs["file"]
 
         return f"{api_key}/videos/{group_id}/{monitor_id}/{file}"
+
+    def _get_etag_prefix(self, **kwargs: Any) -> str:
+        path = self._create_path(**kwargs)
+        digest = blake2b(path.encode(), digest_size=16).hexdigest()
+
+        etag_prefix = f'W/"{digest}-'
+
+        return etag_prefix
+
+    def _get_etag(self, total: int, **kwargs: Any) -> str:
+        """Weak, a recording that is still written changes its size."""
+        etag = f'{self._get_etag_prefix(**kwargs)}{total}"'
+
+        return etag
+
+    def _is_proxy_etag(self, header: str | None, **kwargs: Any) -> bool:
+        etag_prefix = self._get_etag_prefix(**kwargs)
+
+        is_proxy_etag = header is not None and any(
+            value.strip().startswith(etag_prefix) for value in header.split(",")
+        )
+
+        return is_proxy_etag
+
+    @staticmethod
+    def _get_total(result: aiohttp.ClientResponse) -> int | None:
+        """Size of the whole recording, from Content-Range of partial content."""
+        total = None
+
+        if result.status == HTTPStatus.PARTIAL_CONTENT:
+            content_range = result.headers.get(hdrs.CONTENT_RANGE, "")
+            _range, _separator, size = content_range.rpartition("/")
+
+            if size.isdigit():
+                total = int(size)
+
+        elif result.status == HTTPStatus.OK:
+            total = result.content_length
+
+        return total
+
+    def _update_request_header(
+        self, request: web.Request, headers: CIMultiDict, **kwargs: Any
+    ) -> None:
+        """Drop validators of the proxy ETag, the server does not know them.
+
+        A weak ETag never matches If-Range, the whole recording is requested.
+        """
+        if self._is_proxy_etag(headers.get(hdrs.IF_NONE_MATCH), **kwargs):
+            headers.popall(hdrs.IF_NONE_MATCH)
+
+        if self._is_proxy_etag(headers.get(hdrs.IF_RANGE), **kwargs):
+            headers.popall(hdrs.IF_RANGE)
+            headers.popall(hdrs.RANGE, None)
+
+    def _update_response(
+        self,
+        request: web.Request,
+        result: aiohttp.ClientResponse,
+        response: web.StreamResponse,
+        **kwargs: Any,
+    ) -> tuple[int, int | None]:
+        """Add validators, slice the body when the server ignored the range."""
+        response.headers.setdefault(hdrs.ACCEPT_RANGES, "bytes")
+
+        coordinator = self._get_coordinator(kwargs["entry_id"])
+        is_entry_monitor = self._is_entry_monitor(coordinator, **kwargs)
+
+        has_validators = (
+            hdrs.ETAG in result.headers or hdrs.LAST_MODIFIED in result.headers
+        )
+
+        total = self._get_total(result)
+
+        if is_entry_monitor and not has_validators and total is not None:
+            etag = self._get_etag(total, **kwargs)
+
+            response.headers[hdrs.ETAG] = etag
+
+            if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+
+            if self._is_etag_match(if_none_match, etag.removeprefix("W/")):
+                response.set_status(HTTPStatus.NOT_MODIFIED)
+                response.headers.popall(hdrs.CONTENT_RANGE, None)
+                response.headers.popall(hdrs.CONTENT_LENGTH, None)
+
+                return 0, 0
+
+        is_range_ignored = (
+            result.status == HTTPStatus.OK
+            and hdrs.RANGE in request.headers
+            and hdrs.IF_RANGE not in request.headers
+            and total is not None
+        )
+
+        if not is_range_ignored:
+            return 0, None
+
+        return self._set_range(request, response, total)
+
+    @staticmethod
+    def _set_range(
+        request: web.Request, response: web.StreamResponse, total: int
+    ) -> tuple[int, int | None]:
+        """Answer the requested range out of the whole recording."""
+        try:
+            http_range = request.http_range
+            start = http_range.start
+            stop = http_range.stop
+
+        except ValueError:
+            # Multiple or malformed ranges, send the whole recording
+            return 0, None
+
+        if start is None:
+            start = 0
+
+        elif start < 0:
+            # Suffix range, the last -start bytes
+            start = max(total + start, 0)
+
+        stop = total if stop is None else min(stop, total)
+
+        if start >= total or stop <= start:
+            response.set_status(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            response.headers[hdrs.CONTENT_RANGE] = f"bytes */{total}"
+            response.content_length = 0
+
+            return 0, 0
+
+        length = stop - start
+
+        response.set_status(HTTPStatus.PARTIAL_CONTENT)
+        response.headers[hdrs.CONTENT_RANGE] = f"bytes {start}-{stop - 1}/{total}"
+        response.content_length = length
+
+        return start, length
@@ -0,0 +1,241 @@
+"""Benchmark proxying a large recording, buffered vs. RecordingProxyView.
+
+The buffered baseline reads whole bodies into memory, the streamed mode runs
+the requests through a RecordingProxyView of a stub coordinator that points at
+the local upstream. Each mode runs in its own process, peak RSS is reported by
+the process.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from multiprocessing import get_context
+import resource
+import sys
+from time import perf_counter
+from types import SimpleNamespace
+
+import aiohttp
+from aiohttp import web
+
+from custom_components.shinobi.common.consts import (
+    DEFAULT_MAX_MEDIA_REQUESTS,
+    DEFAULT_PROXY_CHUNK_SIZE,
+    DOMAIN,
+)
+from custom_components.shinobi.managers.request_limiter import RequestLimiter
+from custom_components.shinobi.views import RecordingProxyView
+
+RECORDING_SIZE = 512 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+UPSTREAM_PORT = 18081
+PROXY_PORT = 18082
+MODES = ["buffered", "streamed"]
+
+ENTRY_ID = "entry"
+API_KEY = "key"
+GROUP_ID = "group"
+MONITOR_ID = "monitor"
+UPSTREAM_PATH = f"/{API_KEY}/videos/{GROUP_ID}/{MONITOR_ID}"
+PROXY_PATH = f"/api/{DOMAIN}/{ENTRY_ID}{UPSTREAM_PATH}"
+
+root = logging.getLogger()
+root.setLevel(logging.INFO)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(logging.INFO)
+formatter = logging.Formatter("%(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def _upstream_recording(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse()
+    response.content_type = "video/mp4"
+    response.content_length = RECORDING_SIZE
+
+    await response.prepare(request)
+
+    chunk = b"\0" * CHUNK_SIZE
+
+    for _ in range(RECORDING_SIZE // CHUNK_SIZE):
+        await response.write(chunk)
+
+    return response
+
+
+async def _upstream_upload(request: web.Request) -> web.Response:
+    size = 0
+
+    async for chunk in request.content.iter_chunked(CHUNK_SIZE):
+        size += len(chunk)
+
+    return web.Response(text=str(size))
+
+
+def _create_buffered_handler(session: aiohttp.ClientSession):
+    """Baseline, request and response bodies are read into memory."""
+
+    async def _handler(request: web.Request) -> web.StreamResponse:
+        file = request.match_info["file"]
+        url = f"http://127.0.0.1:{UPSTREAM_PORT}{UPSTREAM_PATH}/{file}"
+
+        data = await request.read()
+
+        async with session.request(request.method, url, data=data) as result:
+            response = web.StreamResponse(status=result.status)
+            response.content_type = result.content_type
+
+            await response.prepare(request)
+            await response.write(await result.read())
+
+            return response
+
+    return _handler
+
+
+def _create_view(session: aiohttp.ClientSession) -> RecordingProxyView:
+    """View of a stub coordinator, only what the view reads of it."""
+    config_manager = SimpleNamespace(
+        entry=None,
+        config_data=SimpleNamespace(api_url=f"http://127.0.0.1:{UPSTREAM_PORT}"),
+        proxy_chunk_size=DEFAULT_PROXY_CHUNK_SIZE,
+    )
+
+    coordinator = SimpleNamespace(
+        config_manager=config_manager,
+        session=session,
+        request_limiter=RequestLimiter(DEFAULT_MAX_MEDIA_REQUESTS),
+        api=SimpleNamespace(api_key=API_KEY, group_id=GROUP_ID),
+        monitors={MONITOR_ID: None},
+    )
+
+    hass = SimpleNamespace(data={DOMAIN: {ENTRY_ID: coordinator}})
+
+    view = RecordingProxyView(hass)
+
+    return view
+
+
+def _create_streamed_handler(session: aiohttp.ClientSession):
+    """Requests through the view, authentication of the HTTP component is skipped."""
+    view = _create_view(session)
+
+    async def _handler(request: web.Request) -> web.StreamResponse:
+        if request.method == "GET":
+            return await view.get(request, **request.match_info)
+
+        # The view only routes GET and HEAD, uploads run its request handling
+        return await view._handle_request(request, **request.match_info)
+
+    return _handler
+
+
+async def _start_site(app: web.Application, port: int) -> web.AppRunner:
+    runner = web.AppRunner(app)
+    await runner.setup()
+
+    site = web.TCPSite(runner, "127.0.0.1", port)
+    await site.start()
+
+    return runner
+
+
+async def _upload_body():
+    chunk = b"\0" * CHUNK_SIZE
+
+    for _ in range(RECORDING_SIZE // CHUNK_SIZE):
+        yield chunk
+
+
+async def _async_run(mode: str) -> dict:
+    upstream = web.Application()
+    upstream.router.add_get(f"{UPSTREAM_PATH}/recording.mp4", _upstream_recording)
+    upstream.router.add_post(f"{UPSTREAM_PATH}/upload", _upstream_upload)
+
+    async with aiohttp.ClientSession() as proxy_session:
+        if mode == "buffered":
+            handler = _create_buffered_handler(proxy_session)
+
+        else:
+            handler = _create_streamed_handler(proxy_session)
+
+        proxy = web.Application(client_max_size=RECORDING_SIZE * 2)
+        proxy.router.add_route("*", RecordingProxyView.url, handler)
+
+        runners = [
+            await _start_site(upstream, UPSTREAM_PORT),
+            await _start_site(proxy, PROXY_PORT),
+        ]
+
+        try:
+            async with aiohttp.ClientSession() as client:
+                started_at = perf_counter()
+
+                async with client.get(
+                    f"http://127.0.0.1:{PROXY_PORT}{PROXY_PATH}/recording.mp4"
+                ) as response:
+                    async for _ in response.content.iter_chunked(CHUNK_SIZE):
+                        pass
+
+                download_time = perf_counter() - started_at
+                started_at = perf_counter()
+
+                async with client.post(
+                    f"http://127.0.0.1:{PROXY_PORT}{PROXY_PATH}/upload",
+                    data=_upload_body(),
+                ) as response:
+                    await response.read()
+
+                upload_time = perf_counter() - started_at
+
+        finally:
+            for runner in runners:
+                await runner.cleanup()
+
+    # Linux reports ru_maxrss in KB
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    result = {
+        "download_time": download_time,
+        "upload_time": upload_time,
+        "peak_rss": peak_rss,
+    }
+
+    return result
+
+
+def _run(mode: str, results):
+    results.put((mode, asyncio.run(_async_run(mode))))
+
+
+def main():
+    context = get_context("spawn")
+    size_mb = RECORDING_SIZE / 1024 / 1024
+
+    _LOGGER.info(
+        f"Recording: {size_mb:.0f}MB, chunk size: {DEFAULT_PROXY_CHUNK_SIZE} bytes"
+    )
+
+    for mode in MODES:
+        results = context.Queue()
+
+        process = context.Process(target=_run, args=(mode, results))
+        process.start()
+
+        _mode, result = results.get()
+
+        process.join()
+
+        _LOGGER.info(
+            f"{mode}, "
+            f"download: {size_mb / result['download_time']:.0f}MB/s, "
+            f"upload: {size_mb / result['upload_time']:.0f}MB/s, "
+            f"peak RSS: {result['peak_rss'] / 1024 / 1024:.0f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
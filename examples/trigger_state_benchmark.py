@@ -0,0 +1,113 @@
+"""Benchmark trigger state storage, dict per trigger vs. TriggerStates."""
+from __future__ import annotations
+
+import gc
+import logging
+import sys
+from timeit import timeit
+import tracemalloc
+
+from custom_components.shinobi.models.trigger_state import TriggerStates
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+
+MONITORS = 150
+EVENT_TYPES = [BinarySensorDeviceClass.MOTION, BinarySensorDeviceClass.SOUND]
+LOOKUPS = 100_000
+
+root = logging.getLogger()
+root.setLevel(logging.INFO)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(logging.INFO)
+formatter = logging.Formatter("%(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _build_dicts(monitor_ids: list[str]) -> dict:
+    states = {}
+
+    for monitor_id in monitor_ids:
+        for event_type in EVENT_TYPES:
+            states[f"{monitor_id}::{event_type}"] = {
+                "mid": monitor_id,
+                "event_type": event_type,
+                "name": "trigger",
+                "plug": "plug",
+                "reason": "motion",
+                "is_on": True,
+                "timestamp": 0,
+            }
+
+    return states
+
+
+def _build_trigger_states(monitor_ids: list[str]) -> TriggerStates:
+    states = TriggerStates()
+
+    for monitor_id in monitor_ids:
+        for event_type in EVENT_TYPES:
+            state = states.get_or_create(monitor_id, event_type)
+            state.name = "trigger"
+            state.plug = "plug"
+            state.reason = "motion"
+
+            states.set_state(state, True, 0)
+
+    return states
+
+
+def _measure_memory(builder, monitor_ids: list[str]) -> int:
+    gc.collect()
+    tracemalloc.start()
+
+    states = builder(monitor_ids)
+    size, _peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    del states
+
+    return size
+
+
+def main():
+    monitor_ids = [f"monitor{index}" for index in range(MONITORS)]
+    monitor_id = monitor_ids[MONITORS // 2]
+    event_type = BinarySensorDeviceClass.MOTION
+
+    dict_memory = _measure_memory(_build_dicts, monitor_ids)
+    store_memory = _measure_memory(_build_trigger_states, monitor_ids)
+
+    dicts = _build_dicts(monitor_ids)
+    trigger_states = _build_trigger_states(monitor_ids)
+
+    dict_lookup = timeit(
+        lambda: dicts.get(f"{monitor_id}::{event_type}", {}).get("is_on", False),
+        number=LOOKUPS,
+    )
+    store_lookup = timeit(
+        lambda: trigger_states.is_on(monitor_id, event_type), number=LOOKUPS
+    )
+
+    dict_active = timeit(
+        lambda: [key for key in dicts if dicts[key].get("is_on", False)],
+        number=LOOKUPS // 100,
+    )
+    store_active = timeit(lambda: trigger_states.active, number=LOOKUPS // 100)
+
+    _LOGGER.info(f"Triggers: {MONITORS * len(EVENT_TYPES)}")
+    _LOGGER.info(f"Memory, dict: {dict_memory} bytes, store: {store_memory} bytes")
+    _LOGGER.info(
+        f"Lookup, dict: {dict_lookup / LOOKUPS * 1e9:.0f}ns, "
+        f"store: {store_lookup / LOOKUPS * 1e9:.0f}ns"
+    )
+    _LOGGER.info(
+        f"Active triggers, dict: {dict_active / (LOOKUPS // 100) * 1e6:.1f}us, "
+        f"store: {store_active / (LOOKUPS // 100) * 1e6:.1f}us"
+    )
+
+
+main()
@@ -0,0 +1,23 @@
+"""Test EndpointMetrics."""
+from __future__ import annotations
+
+from custom_components.shinobi.models.endpoint_metrics import EndpointMetrics
+
+
+def test_swap_window():
+    """Swapped window holds the requests since the last swap only."""
+    metrics = EndpointMetrics()
+
+    metrics.stop(metrics.start())
+    metrics.stop(metrics.start())
+
+    window = metrics.swap_window()
+
+    assert window.count == 2
+    assert metrics.window_latency.count == 0
+
+    metrics.stop(metrics.start())
+
+    assert metrics.swap_window().count == 1
+    assert metrics.latency.count == 3
+    assert metrics.in_flight == 0
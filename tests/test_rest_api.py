@@ -0,0 +1,71 @@
+"""Test RestAPI."""
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+import time as time_module
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.shinobi.common.consts import (
+    VIDEO_DETAILS_SIZE,
+    VIDEO_DETAILS_TIME,
+)
+from custom_components.shinobi.managers.rest_api import RestAPI
+
+
+@pytest.fixture(params=["America/New_York", "Asia/Tokyo"])
+def local_time_zone(request, monkeypatch):
+    """West and east of UTC, each moves one side of midnight to another UTC day."""
+    monkeypatch.setenv("TZ", request.param)
+    time_module.tzset()
+
+    yield
+
+    monkeypatch.undo()
+    time_module.tzset()
+
+
+def _get_server_time(day: date, local_time: time) -> str:
+    """Time of a recording as the server sends it, UTC with a trailing Z."""
+    utc_time = datetime.combine(day, local_time).astimezone(timezone.utc)
+
+    server_time = utc_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    return server_time
+
+
+async def test_recording_days_near_midnight(local_time_zone):
+    """Recordings are counted in the local day the range query lists them in."""
+    yesterday = (datetime.today() - timedelta(days=1)).date()
+    today = yesterday + timedelta(days=1)
+
+    api = RestAPI(None, MagicMock())
+    api._async_get = AsyncMock(
+        return_value={
+            "data": [
+                {
+                    VIDEO_DETAILS_TIME: _get_server_time(yesterday, time(23, 30)),
+                    VIDEO_DETAILS_SIZE: 100,
+                },
+                {
+                    VIDEO_DETAILS_TIME: _get_server_time(today, time(0, 30)),
+                    VIDEO_DETAILS_SIZE: 200,
+                },
+            ]
+        }
+    )
+
+    recording_days = await api._async_get_recording_days("monitor")
+
+    assert sorted(recording_days.keys()) == [
+        yesterday.isoformat(),
+        today.isoformat(),
+    ]
+    assert recording_days[yesterday.isoformat()].size == 100
+    assert recording_days[today.isoformat()].size == 200
+
+
+def test_local_date_without_time_zone():
+    """Times without a time zone are local already."""
+    assert RestAPI._get_local_date("2024-01-01T23:30:00") == "2024-01-01"
@@ -0,0 +1,96 @@
+"""Test services."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.shinobi.common.consts import (
+    ATTR_DETECTOR,
+    ATTR_ENABLED,
+    ATTR_GROUP,
+    ATTR_MODE,
+    ATTR_MONITORS,
+    DOMAIN,
+    MONITOR_DETECTORS,
+    SERVICE_SET_DETECTION,
+    SERVICE_SET_MODE,
+)
+from custom_components.shinobi.services import async_setup_services
+
+# Attributes of a service call on the oldest supported Home Assistant, no hass
+SERVICE_CALL_ATTRIBUTES = ["domain", "service", "data", "context", "return_response"]
+
+
+def _create_hass(coordinator) -> MagicMock:
+    hass = MagicMock()
+    hass.data = {DOMAIN: {"entry": coordinator}}
+
+    async_setup_services(hass)
+
+    return hass
+
+
+def _get_handler(hass: MagicMock, service: str):
+    handlers = {
+        call.args[1]: call.args[2]
+        for call in hass.services.async_register.call_args_list
+    }
+
+    return handlers[service]
+
+
+def _create_service_call(service: str, data: dict) -> MagicMock:
+    service_call = MagicMock(spec=SERVICE_CALL_ATTRIBUTES)
+    service_call.domain = DOMAIN
+    service_call.service = service
+    service_call.data = data
+
+    return service_call
+
+
+async def test_set_detection():
+    """Registered handler reaches the coordinators without hass on the call."""
+    detector = list(MONITOR_DETECTORS.keys())[0]
+
+    coordinator = MagicMock()
+    coordinator.monitors = {"monitor": MagicMock()}
+    coordinator.set_detection = AsyncMock(return_value={"monitor": True})
+
+    hass = _create_hass(coordinator)
+    handler = _get_handler(hass, SERVICE_SET_DETECTION)
+
+    service_call = _create_service_call(
+        SERVICE_SET_DETECTION,
+        {
+            ATTR_MONITORS: ["monitor", "missing"],
+            ATTR_DETECTOR: detector,
+            ATTR_ENABLED: True,
+        },
+    )
+
+    response = await handler(service_call)
+
+    coordinator.set_detection.assert_awaited_once_with(
+        ["monitor"], MONITOR_DETECTORS[detector], True
+    )
+    assert response == {ATTR_MONITORS: {"monitor": True, "missing": False}}
+
+
+async def test_set_mode():
+    """Registered handler reaches the coordinators without hass on the call."""
+    monitors = {"monitor": MagicMock(group_id="group"), "other": MagicMock()}
+
+    coordinator = MagicMock()
+    coordinator.monitors = monitors
+    coordinator.set_monitors_mode = AsyncMock(return_value={"monitor": True})
+
+    hass = _create_hass(coordinator)
+    handler = _get_handler(hass, SERVICE_SET_MODE)
+
+    service_call = _create_service_call(
+        SERVICE_SET_MODE, {ATTR_GROUP: "group", ATTR_MODE: "record"}
+    )
+
+    response = await handler(service_call)
+
+    coordinator.set_monitors_mode.assert_awaited_once_with(["monitor"], "record")
+    assert response == {ATTR_MONITORS: {"monitor": True}}
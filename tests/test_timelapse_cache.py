@@ -0,0 +1,60 @@
+"""Test TimelapseCache."""
+from __future__ import annotations
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.shinobi.managers.request_limiter import RequestLimiter
+from custom_components.shinobi.managers.timelapse_cache import TimelapseCache
+
+FRAME = b"frame"
+
+
+async def _async_add_executor_job(target, *args):
+    return target(*args)
+
+
+def _create_cache(tmp_path) -> tuple[TimelapseCache, MagicMock]:
+    hass = MagicMock()
+    hass.config.path = lambda *parts: os.path.join(tmp_path, *parts)
+    hass.async_add_executor_job = _async_add_executor_job
+    hass.async_create_task = asyncio.get_running_loop().create_task
+
+    config_manager = MagicMock()
+    config_manager.entry_id = "entry"
+    config_manager.timelapse_cache_size = 1024
+
+    api = MagicMock()
+    api.get_timelapse_frame = AsyncMock(return_value=FRAME)
+
+    cache = TimelapseCache(hass, config_manager, api, RequestLimiter(1))
+
+    return cache, api
+
+
+async def test_get_fetches_once(tmp_path):
+    """Second request is served from the disk cache."""
+    cache, api = _create_cache(tmp_path)
+
+    assert await cache.get("monitor", "2024-01-01", "frame.jpg") == FRAME
+    assert await cache.get("monitor", "2024-01-01", "frame.jpg") == FRAME
+
+    api.get_timelapse_frame.assert_awaited_once()
+
+
+async def test_get_removed_file(tmp_path):
+    """A file removed before it was read is a miss, not an error."""
+    cache, api = _create_cache(tmp_path)
+
+    await cache.get("monitor", "2024-01-01", "frame.jpg")
+
+    file_name = cache._get_file_name("monitor", "2024-01-01", "frame.jpg")
+    os.remove(cache._get_path(file_name))
+
+    assert await cache.get("monitor", "2024-01-01", "frame.jpg") is None
+    assert cache.data["items"] == 0
+    assert cache.data["size"] == 0
+
+    assert await cache.get("monitor", "2024-01-01", "frame.jpg") == FRAME
+    assert api.get_timelapse_frame.await_count == 2
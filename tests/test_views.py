@@ -0,0 +1,213 @@
+"""Test proxy views."""
+from __future__ import annotations
+
+import asyncio
+import gc
+from http import HTTPStatus
+from unittest.mock import MagicMock
+
+from aiohttp import hdrs, web
+from aiohttp.test_utils import make_mocked_request
+from multidict import CIMultiDict
+
+from custom_components.shinobi.common.consts import DOMAIN
+from custom_components.shinobi.views import RecordingProxyView, ThumbnailsProxyView
+
+TOTAL = 1000
+
+KWARGS = {
+    "entry_id": "entry",
+    "api_key": "key",
+    "group_id": "group",
+    "monitor_id": "monitor",
+    "file": "recording.mp4",
+}
+
+
+def _create_view() -> RecordingProxyView:
+    coordinator = MagicMock()
+    coordinator.api.api_key = "key"
+    coordinator.api.group_id = "group"
+    coordinator.monitors = {"monitor": MagicMock()}
+
+    hass = MagicMock()
+    hass.data = {DOMAIN: {"entry": coordinator}}
+
+    view = RecordingProxyView(hass)
+
+    return view
+
+
+def _create_result(status: int = HTTPStatus.OK, headers: dict | None = None):
+    result = MagicMock()
+    result.status = status
+    result.content_length = TOTAL
+    result.headers = CIMultiDict(headers or {})
+
+    return result
+
+
+def _set_range(range_header: str) -> tuple[web.StreamResponse, tuple]:
+    request = make_mocked_request("GET", "/", headers={hdrs.RANGE: range_header})
+    response = web.StreamResponse()
+
+    body_range = RecordingProxyView._set_range(request, response, TOTAL)
+
+    return response, body_range
+
+
+def test_range_closed():
+    response, body_range = _set_range("bytes=100-199")
+
+    assert body_range == (100, 100)
+    assert response.status == HTTPStatus.PARTIAL_CONTENT
+    assert response.headers[hdrs.CONTENT_RANGE] == f"bytes 100-199/{TOTAL}"
+    assert response.content_length == 100
+
+
+def test_range_suffix():
+    response, body_range = _set_range("bytes=-300")
+
+    assert body_range == (700, 300)
+    assert response.status == HTTPStatus.PARTIAL_CONTENT
+    assert response.headers[hdrs.CONTENT_RANGE] == f"bytes 700-999/{TOTAL}"
+
+
+def test_range_suffix_larger_than_recording():
+    response, body_range = _set_range("bytes=-5000")
+
+    assert body_range == (0, TOTAL)
+    assert response.headers[hdrs.CONTENT_RANGE] == f"bytes 0-999/{TOTAL}"
+
+
+def test_range_open_ended():
+    response, body_range = _set_range("bytes=900-")
+
+    assert body_range == (900, 100)
+    assert response.status == HTTPStatus.PARTIAL_CONTENT
+    assert response.headers[hdrs.CONTENT_RANGE] == f"bytes 900-999/{TOTAL}"
+
+
+def test_range_end_beyond_recording():
+    response, body_range = _set_range("bytes=900-5000")
+
+    assert body_range == (900, 100)
+    assert response.headers[hdrs.CONTENT_RANGE] == f"bytes 900-999/{TOTAL}"
+
+
+def test_range_unsatisfiable():
+    response, body_range = _set_range(f"bytes={TOTAL}-")
+
+    assert body_range == (0, 0)
+    assert response.status == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+    assert response.headers[hdrs.CONTENT_RANGE] == f"bytes */{TOTAL}"
+
+
+def test_range_multiple_sends_whole_recording():
+    response, body_range = _set_range("bytes=0-99,200-299")
+
+    assert body_range == (0, None)
+    assert response.status == HTTPStatus.OK
+    assert hdrs.CONTENT_RANGE not in response.headers
+
+
+def test_update_response_slices_ignored_range():
+    view = _create_view()
+    request = make_mocked_request("GET", "/", headers={hdrs.RANGE: "bytes=-100"})
+    response = web.StreamResponse()
+
+    body_range = view._update_response(request, _create_result(), response, **KWARGS)
+
+    assert body_range == (900, 100)
+    assert response.status == HTTPStatus.PARTIAL_CONTENT
+    assert response.headers[hdrs.ACCEPT_RANGES] == "bytes"
+
+
+def test_update_response_revalidation():
+    view = _create_view()
+    etag = view._get_etag(TOTAL, **KWARGS)
+
+    request = make_mocked_request("GET", "/", headers={hdrs.IF_NONE_MATCH: etag})
+    response = web.StreamResponse()
+
+    body_range = view._update_response(request, _create_result(), response, **KWARGS)
+
+    assert body_range == (0, 0)
+    assert response.status == HTTPStatus.NOT_MODIFIED
+    assert response.headers[hdrs.ETAG] == etag
+
+
+def test_update_response_revalidation_of_changed_size():
+    view = _create_view()
+    etag = view._get_etag(TOTAL - 1, **KWARGS)
+
+    request = make_mocked_request("GET", "/", headers={hdrs.IF_NONE_MATCH: etag})
+    response = web.StreamResponse()
+
+    body_range = view._update_response(request, _create_result(), response, **KWARGS)
+
+    assert body_range == (0, None)
+    assert response.status == HTTPStatus.OK
+    assert response.headers[hdrs.ETAG] == view._get_etag(TOTAL, **KWARGS)
+
+
+def test_update_response_keeps_server_validators():
+    view = _create_view()
+    request = make_mocked_request("GET", "/")
+    response = web.StreamResponse(headers={hdrs.ETAG: '"server"'})
+    result = _create_result(headers={hdrs.ETAG: '"server"'})
+
+    view._update_response(request, result, response, **KWARGS)
+
+    assert response.headers[hdrs.ETAG] == '"server"'
+
+
+def test_update_response_other_server_monitor():
+    view = _create_view()
+    kwargs = {**KWARGS, "api_key": "other"}
+    etag = view._get_etag(TOTAL, **kwargs)
+
+    request = make_mocked_request("GET", "/", headers={hdrs.IF_NONE_MATCH: etag})
+    response = web.StreamResponse()
+
+    body_range = view._update_response(request, _create_result(), response, **kwargs)
+
+    assert body_range == (0, None)
+    assert response.status == HTTPStatus.OK
+    assert hdrs.ETAG not in response.headers
+
+
+async def test_coalesced_fetch_failure_without_clients():
+    """A fetch failing after its clients went away is not reported as unretrieved."""
+    loop = asyncio.get_running_loop()
+    contexts = []
+    loop.set_exception_handler(lambda _loop, context: contexts.append(context))
+
+    started = asyncio.Event()
+
+    async def _async_fetch(*_args):
+        started.set()
+        await asyncio.sleep(0)
+
+        raise ConnectionError("Server went away")
+
+    hass = MagicMock()
+    hass.async_create_task = loop.create_task
+
+    view = ThumbnailsProxyView(hass)
+    view._async_fetch = _async_fetch
+
+    client = loop.create_task(
+        view._async_get_coalesced(MagicMock(), "http://server/thumb", {}, {})
+    )
+
+    await started.wait()
+
+    client.cancel()
+
+    await asyncio.sleep(0.01)
+
+    gc.collect()
+
+    assert view._pending == {}
+    assert contexts == []
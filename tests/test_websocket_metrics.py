@@ -0,0 +1,22 @@
+"""Test WebSocketMetrics."""
+from __future__ import annotations
+
+from custom_components.shinobi.models.websocket_metrics import WebSocketMetrics
+
+
+def test_swap_handler_time_window():
+    """Swapped window holds the handler time of all events since the last swap."""
+    metrics = WebSocketMetrics()
+
+    metrics.add_handler_time("detector_trigger", 0.001)
+    metrics.add_handler_time("monitor_status", 0.002)
+
+    window = metrics.swap_handler_time_window()
+
+    assert window.count == 2
+    assert metrics.window_handler_time.count == 0
+
+    metrics.add_handler_time("detector_trigger", 0.001)
+
+    assert metrics.swap_handler_time_window().count == 1
+    assert metrics.handler_time["detector_trigger"].count == 2
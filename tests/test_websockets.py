@@ -0,0 +1,68 @@
+"""Test WebSockets."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+from custom_components.shinobi.common.consts import SIGNAL_MONITOR_TRIGGER
+from custom_components.shinobi.managers.websockets import WebSockets
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+
+EVENT_DURATION = 0.05
+
+
+def _create_websockets(signals: list) -> WebSockets:
+    config_manager = MagicMock()
+    config_manager.entry_id = "entry"
+    config_manager.get_event_duration.return_value = EVENT_DURATION
+
+    websockets = WebSockets(None, config_manager)
+    websockets.set_local_async_dispatcher_send(
+        lambda signal, *args: signals.append((signal, *args))
+    )
+
+    return websockets
+
+
+async def test_trigger_expires():
+    """Active trigger is turned off once its event duration ends."""
+    signals = []
+    websockets = _create_websockets(signals)
+
+    state = websockets._trigger_states.get_or_create(
+        "monitor", BinarySensorDeviceClass.MOTION
+    )
+    websockets._set_trigger_state(state, True)
+    websockets._schedule_trigger_expiry(state)
+
+    await asyncio.sleep(EVENT_DURATION * 2)
+
+    assert (
+        SIGNAL_MONITOR_TRIGGER,
+        "entry",
+        "monitor",
+        BinarySensorDeviceClass.MOTION,
+        False,
+    ) in signals
+
+
+async def test_terminate_cancels_trigger_expiry():
+    """Nothing fires after terminate, even with an active trigger."""
+    signals = []
+    websockets = _create_websockets(signals)
+
+    state = websockets._trigger_states.get_or_create(
+        "monitor", BinarySensorDeviceClass.MOTION
+    )
+    websockets._set_trigger_state(state, True)
+    websockets._schedule_trigger_expiry(state)
+
+    await websockets.terminate()
+
+    signals.clear()
+
+    await asyncio.sleep(EVENT_DURATION * 2)
+
+    assert [signal for signal in signals if signal[0] == SIGNAL_MONITOR_TRIGGER] == []
+    assert state.timer is None
+    assert not websockets.get_trigger_state("monitor", BinarySensorDeviceClass.MOTION)